@@ -1,5 +1,7 @@
 """Pytest configuration and fixtures."""
 
+import os
+
 import pytest
 import yaml
 from pathlib import Path
@@ -10,32 +12,37 @@ from workflow_engine.dsl.schema import WorkflowDefinition as DSLWorkflowDefiniti
 from workflow_engine.storage.models import WorkflowDefinition, WorkflowExecution, WorkflowExecutionStatus
 from workflow_engine.core.workflow_executor import WorkflowExecutor
 
+# Prefer the libyaml-backed loader; yaml.safe_load always uses the pure-Python one
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_workflow_yaml():
-    """Load sample workflow YAML."""
+    """Load sample workflow YAML (shared across the session, treat as read-only)."""
     fixtures_path = Path(__file__).parent / "fixtures" / "sample_workflows.yaml"
     with open(fixtures_path) as f:
-        workflows = yaml.safe_load(f)
+        workflows = yaml.load(f, Loader=_YamlLoader)
     return workflows["simple_workflow"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_workflow_definition(sample_workflow_yaml):
-    """Create a sample workflow definition."""
-    from workflow_engine.dsl.parser import WorkflowParser
-    return WorkflowParser.parse_yaml(yaml.dump(sample_workflow_yaml))
+    """Create a sample workflow definition (validated once per session)."""
+    return DSLWorkflowDefinition.model_validate(sample_workflow_yaml)
 
 
 @pytest.fixture
 def mock_workflow_repository():
     """Mock workflow repository."""
-    repo = AsyncMock()
+    repo = MagicMock()
     repo.create = AsyncMock()
     repo.get_by_id = AsyncMock()
     repo.get_by_name = AsyncMock()
+    repo.get_by_names = AsyncMock(return_value=[])
     repo.list_all = AsyncMock(return_value=[])
+    repo.count = AsyncMock(return_value=0)
     repo.update = AsyncMock()
+    repo.save_all = AsyncMock()
     repo.delete = AsyncMock(return_value=True)
     return repo
 
@@ -43,12 +50,13 @@ def mock_workflow_repository():
 @pytest.fixture
 def mock_execution_repository():
     """Mock execution repository."""
-    repo = AsyncMock()
+    repo = MagicMock()
     repo.create = AsyncMock()
     repo.get_by_id = AsyncMock()
     repo.get_by_temporal_id = AsyncMock()
     repo.list_by_workflow = AsyncMock(return_value=[])
     repo.list_all = AsyncMock(return_value=[])
+    repo.count = AsyncMock(return_value=0)
     repo.update = AsyncMock()
     repo.update_status = AsyncMock()
     return repo
@@ -66,20 +74,39 @@ def mock_workflow_executor():
     return executor
 
 
-@pytest.fixture
-def sample_workflow_db_model(sample_workflow_definition):
-    """Create a sample workflow database model."""
+@pytest.fixture(scope="session")
+def _sample_workflow_yaml_serialized(sample_workflow_definition):
+    """Serialize the sample workflow definition once per session.
+
+    Returns:
+        Tuple of (definition_yaml, definition_json)
+    """
     from workflow_engine.dsl.parser import WorkflowParser
-    return WorkflowDefinition(
-        id=uuid4(),
-        name=sample_workflow_definition.name,
-        version=sample_workflow_definition.version,
-        description=sample_workflow_definition.description,
-        definition_yaml=WorkflowParser.to_yaml(sample_workflow_definition),
-        definition_json=sample_workflow_definition.model_dump(mode='json'),
+    return (
+        WorkflowParser.to_yaml(sample_workflow_definition),
+        sample_workflow_definition.model_dump(mode='json'),
     )
 
 
+@pytest.fixture(scope="session")
+def _wf_db_proto(sample_workflow_definition, _sample_workflow_yaml_serialized):
+    """Column values shared by every sample workflow database model."""
+    definition_yaml, definition_json = _sample_workflow_yaml_serialized
+    return {
+        "name": sample_workflow_definition.name,
+        "version": sample_workflow_definition.version,
+        "description": sample_workflow_definition.description,
+        "definition_yaml": definition_yaml,
+        "definition_json": definition_json,
+    }
+
+
+@pytest.fixture
+def sample_workflow_db_model(_wf_db_proto):
+    """Create a sample workflow database model."""
+    return WorkflowDefinition(id=uuid4(), **_wf_db_proto)
+
+
 @pytest.fixture
 def sample_execution_db_model(sample_workflow_db_model):
     """Create a sample execution database model."""
@@ -91,3 +118,27 @@ def sample_execution_db_model(sample_workflow_db_model):
         parameters={},
     )
 
+
+
+@pytest.fixture(scope="session")
+def integration_database():
+    """Create the schema once per session on a dedicated integration database.
+
+    The database comes from TEST_DATABASE_URL, never the app's DATABASE_URL,
+    because its tables are dropped before and after the session; tests
+    using this fixture are skipped when it is unset. Dropping first lets
+    create_all skip its per-table existence checks.
+    """
+    from workflow_engine.storage import database
+
+    database_url = os.getenv("TEST_DATABASE_URL")
+    if not database_url:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    database.init_db(
+        database_url,
+        database_url.replace("postgresql://", "postgresql+asyncpg://"),
+    )
+    database.Base.metadata.drop_all(bind=database.sync_engine)
+    database.Base.metadata.create_all(bind=database.sync_engine, checkfirst=False)
+    yield database
+    database.Base.metadata.drop_all(bind=database.sync_engine)
@@ -16,23 +16,18 @@ pytestmark = pytest.mark.skipif(
 )
 
 
-@pytest.mark.asyncio
 async def test_workflow_definition_storage():
     """Test storing and retrieving workflow definitions."""
     # This would test actual database operations
-    # For now, just a placeholder
-    pass
+    pytest.skip("placeholder: not implemented yet")
 
 
-@pytest.mark.asyncio
 async def test_workflow_execution_flow():
     """Test end-to-end workflow execution."""
     # This would test actual Temporal workflow execution
-    # For now, just a placeholder
-    pass
+    pytest.skip("placeholder: not implemented yet")
 
 
-@pytest.mark.asyncio
 async def test_compensation_execution_on_failure():
     """Test that compensations execute when workflow fails."""
     # This would test:
@@ -40,30 +35,27 @@ async def test_compensation_execution_on_failure():
     # 2. Execute workflow where a task fails
     # 3. Verify compensations were executed in reverse order
     # 4. Verify database status is updated to FAILED
-    pass
+    pytest.skip("placeholder: not implemented yet")
 
 
-@pytest.mark.asyncio
 async def test_compensation_execution_order():
     """Test that compensations execute in reverse order of completion."""
     # This would test:
     # 1. Create workflow with multiple tasks having compensation
     # 2. Execute workflow where later task fails
     # 3. Verify compensations executed in reverse order (last completed first)
-    pass
+    pytest.skip("placeholder: not implemented yet")
 
 
-@pytest.mark.asyncio
 async def test_compensation_without_compensation_defined():
     """Test workflow with some tasks having compensation and some not."""
     # This would test:
     # 1. Create workflow where only some tasks have compensation
     # 2. Execute workflow where task without compensation fails
     # 3. Verify only tasks with compensation are rolled back
-    pass
+    pytest.skip("placeholder: not implemented yet")
 
 
-@pytest.mark.asyncio
 async def test_database_status_update_on_failure():
     """Test that database status is updated when workflow fails."""
     # This would test:
@@ -71,10 +63,9 @@ async def test_database_status_update_on_failure():
     # 2. Verify WorkflowExecution status is updated to FAILED
     # 3. Verify error message is stored
     # 4. Verify completed_at timestamp is set
-    pass
+    pytest.skip("placeholder: not implemented yet")
 
 
-@pytest.mark.asyncio
 async def test_database_status_update_on_success():
     """Test that database status is updated when workflow succeeds."""
     # This would test:
@@ -82,6 +73,6 @@ async def test_database_status_update_on_success():
     # 2. Verify WorkflowExecution status is updated to COMPLETED
     # 3. Verify result is stored
     # 4. Verify completed_at timestamp is set
-    pass
+    pytest.skip("placeholder: not implemented yet")
 
 
@@ -0,0 +1,27 @@
+"""Unit tests for shared approval polling."""
+
+import asyncio
+import time
+
+from workflow_engine.core.activities import base
+
+
+async def test_waiter_stops_at_its_own_deadline(monkeypatch):
+    """Test a waiter joining a longer-running poller still times out at its own deadline."""
+
+    async def never_decided(approval_id, poll_interval, deadline):
+        await asyncio.sleep(max(deadline - time.monotonic(), 0))
+        return None
+
+    monkeypatch.setattr(base, "_poll_approval", never_decided)
+    now = time.monotonic()
+    long_waiter = asyncio.create_task(base._wait_for_approval_decision("approval-1", 0.1, now + 5))
+    await asyncio.sleep(0)
+
+    started = time.monotonic()
+    assert await base._wait_for_approval_decision("approval-1", 0.1, now + 0.05) is None
+    assert time.monotonic() - started < 1
+
+    long_waiter.cancel()
+    await asyncio.gather(long_waiter, return_exceptions=True)
+    assert "approval-1" not in base._approval_pollers
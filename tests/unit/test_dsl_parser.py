@@ -1,9 +1,10 @@
 """Unit tests for DSL parser."""
 
+from datetime import timedelta
+
 import pytest
-import yaml
-from pathlib import Path
 
+from workflow_engine.dsl.durations import parse_duration
 from workflow_engine.dsl.parser import WorkflowParser
 from workflow_engine.dsl.validator import WorkflowValidator
 from workflow_engine.dsl.schema import WorkflowDefinition
@@ -35,19 +36,28 @@ def test_parse_invalid_yaml():
         WorkflowParser.parse_yaml(yaml_content)
 
 
-def test_parse_file(sample_workflow_yaml):
+def test_parse_file(_sample_workflow_yaml_serialized, tmp_path):
     """Test parsing from file."""
-    # Create temporary file
-    import tempfile
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        yaml.dump(sample_workflow_yaml, f)
-        temp_path = f.name
+    definition_yaml, _ = _sample_workflow_yaml_serialized
+    workflow_file = tmp_path / "wf.yaml"
+    workflow_file.write_text(definition_yaml)
+
+    workflow = WorkflowParser.parse_file(workflow_file)
+    assert workflow.name == "simple-workflow"
+
+
+def test_parse_file_rereads_changed_file(_sample_workflow_yaml_serialized, tmp_path):
+    """Test cached parses are returned as copies and dropped when the file changes."""
+    definition_yaml, _ = _sample_workflow_yaml_serialized
+    workflow_file = tmp_path / "wf.yaml"
+    workflow_file.write_text(definition_yaml)
 
-    try:
-        workflow = WorkflowParser.parse_file(temp_path)
-        assert workflow.name == "simple-workflow"
-    finally:
-        Path(temp_path).unlink()
+    first = WorkflowParser.parse_file(workflow_file)
+    first.name = "mutated"
+    assert WorkflowParser.parse_file(workflow_file).name == "simple-workflow"
+
+    workflow_file.write_text(definition_yaml.replace("simple-workflow", "renamed-workflow"))
+    assert WorkflowParser.parse_file(workflow_file).name == "renamed-workflow"
 
 
 def test_validate_workflow(sample_workflow_definition):
@@ -101,3 +111,37 @@ tasks:
     with pytest.raises(ValueError, match="unknown task"):
         WorkflowParser.parse_yaml(yaml_content)
 
+
+
+def test_validate_reflects_changed_tasks(sample_workflow_definition):
+    """Test the validator checks the current tasks, not those the model was built with."""
+    workflow = sample_workflow_definition.model_copy(deep=True)
+    workflow.tasks.append(workflow.tasks[0].model_copy(update={"id": "extra", "depends_on": ["missing"]}))
+    assert "Task 'extra': Dependency 'missing' does not exist" in WorkflowValidator.validate(workflow)
+
+    duplicated = sample_workflow_definition.model_copy(
+        update={"tasks": [sample_workflow_definition.tasks[0]] * 2}
+    )
+    assert "Task IDs must be unique" in WorkflowValidator.validate(duplicated)
+
+
+
+def test_execution_settings_follow_field_changes(sample_workflow_definition):
+    """Test timeout_td and temporal_retry_policy reflect reassigned fields."""
+    task = sample_workflow_definition.tasks[0].model_copy(deep=True)
+    task.timeout = "2m"
+    task.retry = None
+    assert task.timeout_td == timedelta(minutes=2)
+    assert task.temporal_retry_policy is None
+
+
+
+def test_parse_duration():
+    """Test duration strings convert to timedeltas and reject unknown units."""
+    assert parse_duration("30s") == timedelta(seconds=30)
+    assert parse_duration("1.5m") == timedelta(seconds=90)
+    assert parse_duration("2h") == timedelta(hours=2)
+    with pytest.raises(ValueError, match="Invalid duration unit"):
+        parse_duration("5d")
+    with pytest.raises(ValueError, match="cannot be empty"):
+        parse_duration("")
@@ -0,0 +1,32 @@
+"""Unit tests for keyset pagination cursors."""
+
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from workflow_engine.storage.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    """Test a full page yields a cursor decoding to its last row's sort key."""
+    rows = [SimpleNamespace(created_at=datetime(2024, 1, 2, 3, 4, 5, 678), id=uuid4()) for _ in range(2)]
+
+    cursor = encode_cursor(rows, limit=2)
+
+    assert decode_cursor(cursor) == (rows[-1].created_at, rows[-1].id)
+
+
+def test_short_page_has_no_cursor():
+    """Test a page smaller than the limit is the last one."""
+    rows = [SimpleNamespace(created_at=datetime(2024, 1, 1), id=uuid4())]
+
+    assert encode_cursor(rows, limit=2) is None
+    assert encode_cursor([], limit=2) is None
+
+
+def test_malformed_cursor_rejected():
+    """Test a malformed cursor raises ValueError."""
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
@@ -0,0 +1,31 @@
+"""Unit tests for the orjson payload converter."""
+
+import dataclasses
+import math
+
+from temporalio.converter import JSONPlainPayloadConverter
+
+from workflow_engine.core.payload_converter import ORJSONPlainPayloadConverter
+
+
+@dataclasses.dataclass
+class _Point:
+    y: int
+    x: int
+
+
+def test_payloads_decode_like_default_converter():
+    """Test values orjson handles differently round-trip as with the default converter."""
+    converter = ORJSONPlainPayloadConverter()
+    default = JSONPlainPayloadConverter()
+
+    for value in [{"big": 2**70}, [1.5, None, "ü"], {"nested": {"b": 1, "a": [True, None]}}]:
+        assert default.from_payload(converter.to_payload(value)) == value
+        assert converter.from_payload(default.to_payload(value)) == value
+
+    for value in [float("nan"), {"limit": float("inf")}]:
+        payload = converter.to_payload(value)
+        assert payload.data == default.to_payload(value).data
+    assert math.isnan(converter.from_payload(converter.to_payload(float("nan"))))
+
+    assert converter.to_payload(_Point(y=1, x=2)).data == b'{"x":2,"y":1}'
@@ -0,0 +1,79 @@
+"""Unit tests for dependency scheduler."""
+
+import asyncio
+from unittest.mock import patch
+
+from workflow_engine.core.scheduler import DependencyScheduler
+from workflow_engine.core.workflows import WorkflowEngineWorkflow
+from workflow_engine.dsl.schema import Task, WorkflowDefinition
+
+
+def _task(task_id, depends_on=None):
+    return Task(id=task_id, name=task_id, type="activity", activity_type="noop", depends_on=depends_on)
+
+
+def test_diamond_dependencies():
+    """Test tasks become ready only once all their dependencies complete."""
+    scheduler = DependencyScheduler([
+        _task("a"),
+        _task("b", ["a"]),
+        _task("c", ["a"]),
+        _task("d", ["b", "c"]),
+    ])
+
+    assert [t.id for t in scheduler.drain_ready()] == ["a"]
+    assert [t.id for t in scheduler.mark_completed("a")] == ["b", "c"]
+    assert [t.id for t in scheduler.drain_ready()] == ["b", "c"]
+    assert scheduler.mark_completed("b") == []
+    assert [t.id for t in scheduler.mark_completed("c")] == ["d"]
+    assert scheduler.pop_ready().id == "d"
+    scheduler.mark_completed("d")
+
+    assert scheduler.remaining == 0
+    assert not scheduler.has_ready()
+
+
+def test_repeated_dependency_counted_once():
+    """Test a dependency listed twice does not block the task."""
+    scheduler = DependencyScheduler([_task("a"), _task("b", ["a", "a"])])
+    scheduler.drain_ready()
+
+    assert [t.id for t in scheduler.mark_completed("a")] == ["b"]
+
+
+async def test_wave_scheduling_starts_tasks_in_definition_order():
+    """Test the pre-patch wave path starts each wave in definition order."""
+    tasks = [_task("a"), _task("b"), _task("d", ["b"]), _task("c", ["a"])]
+    definition = WorkflowDefinition(name="waves", tasks=tasks)
+    workflow = WorkflowEngineWorkflow()
+    started = []
+
+    async def execute(task, workflow_def, parameters):
+        started.append(task.id)
+        return task.id
+
+    workflow._execute_task_with_retry = execute
+    await workflow._run_in_waves(DependencyScheduler(definition.tasks), definition, {})
+
+    assert started == ["a", "b", "d", "c"]
+    assert workflow.completed_tasks_order == ["a", "b", "d", "c"]
+
+
+async def test_ready_scheduling_handles_finished_tasks_in_start_order():
+    """Test tasks finishing together are recorded in start order, whatever order wait reports."""
+    tasks = [_task("a"), _task("b"), _task("c")]
+    definition = WorkflowDefinition(name="ready", tasks=tasks)
+    workflow = WorkflowEngineWorkflow()
+
+    async def execute(task, workflow_def, parameters):
+        return task.id
+
+    async def wait_reversed(futures, return_when):
+        done, pending = await asyncio.wait(futures, return_when=asyncio.ALL_COMPLETED)
+        return list(reversed(futures)), pending
+
+    workflow._execute_task_with_retry = execute
+    with patch("workflow_engine.core.workflows.workflow.wait", side_effect=wait_reversed):
+        await workflow._run_as_ready(DependencyScheduler(definition.tasks), definition, {})
+
+    assert workflow.completed_tasks_order == ["a", "b", "c"]
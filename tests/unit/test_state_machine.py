@@ -1,7 +1,9 @@
 """Unit tests for state machine."""
 
 import pytest
-from workflow_engine.core.state_machine import WorkflowStateMachine, WorkflowState
+from datetime import datetime
+
+from workflow_engine.core.state_machine import StateTransition, WorkflowStateMachine, WorkflowState
 
 
 def test_initial_state():
@@ -38,3 +40,36 @@ def test_transition_history():
     assert transitions[1].from_state == WorkflowState.RUNNING
     assert transitions[1].to_state == WorkflowState.COMPLETED
 
+
+
+def test_transition_history_is_read_only_view():
+    """Test get_transitions returns a live, read-only view."""
+    sm = WorkflowStateMachine()
+    transitions = sm.get_transitions()
+    assert not hasattr(transitions, "append")
+
+    sm.transition(WorkflowState.RUNNING)
+    assert len(transitions) == 1
+    assert list(transitions)[0].to_state == WorkflowState.RUNNING
+
+
+def test_subclass_transition_table_is_used():
+    """Test can_transition reads the (possibly overridden) transition table."""
+
+    class NoRetryStateMachine(WorkflowStateMachine):
+        VALID_TRANSITIONS = {
+            **WorkflowStateMachine.VALID_TRANSITIONS,
+            WorkflowState.FAILED: frozenset(),
+        }
+
+    sm = NoRetryStateMachine(WorkflowState.FAILED)
+    assert sm.can_transition(WorkflowState.RUNNING) is False
+    assert WorkflowStateMachine(WorkflowState.FAILED).can_transition(WorkflowState.RUNNING) is True
+
+
+def test_transition_keeps_given_timestamp():
+    """Test an explicit timestamp is stored unchanged."""
+    timestamp = datetime(2024, 1, 1, 12, 0, 0, 123456)
+    transition = StateTransition(WorkflowState.PENDING, WorkflowState.RUNNING, timestamp)
+    assert transition.timestamp == timestamp
+    assert StateTransition(WorkflowState.PENDING, WorkflowState.RUNNING).timestamp.tzinfo is None
@@ -0,0 +1,62 @@
+"""Unit tests for batched execution status writes."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from workflow_engine.core import status_flusher as status_flusher_module
+from workflow_engine.core.status_flusher import StatusFlusher
+from workflow_engine.storage.models import WorkflowExecutionStatus
+
+
+async def test_concurrent_updates_share_one_write(monkeypatch):
+    """Test updates submitted together are written in one batch and acked per execution."""
+    existing, missing = uuid4(), uuid4()
+    finalize_many = AsyncMock(return_value={existing})
+
+    @asynccontextmanager
+    async def fake_session():
+        yield object()
+
+    monkeypatch.setattr(status_flusher_module.database, "get_async_session", fake_session)
+    monkeypatch.setattr(
+        status_flusher_module.SQLAlchemyExecutionRepository, "finalize_many", finalize_many
+    )
+
+    flusher = StatusFlusher(interval=0.01)
+    try:
+        results = await asyncio.gather(
+            flusher.submit(existing, WorkflowExecutionStatus.COMPLETED, result={"ok": True}),
+            flusher.submit(missing, WorkflowExecutionStatus.FAILED, error="boom"),
+        )
+    finally:
+        await flusher.close()
+
+    assert results == [True, False]
+    finalize_many.assert_awaited_once()
+    assert [update[0] for update in finalize_many.await_args.args[0]] == [existing, missing]
+
+
+async def test_close_flushes_batch_in_hand(monkeypatch):
+    """Test closing while the writer holds a collected batch still writes it."""
+    execution_id = uuid4()
+    finalize_many = AsyncMock(return_value={execution_id})
+
+    @asynccontextmanager
+    async def fake_session():
+        yield object()
+
+    monkeypatch.setattr(status_flusher_module.database, "get_async_session", fake_session)
+    monkeypatch.setattr(
+        status_flusher_module.SQLAlchemyExecutionRepository, "finalize_many", finalize_many
+    )
+
+    flusher = StatusFlusher(interval=0.05)
+    submitted = asyncio.create_task(flusher.submit(execution_id, WorkflowExecutionStatus.COMPLETED))
+    # Let the writer take the update and start waiting for more
+    await asyncio.sleep(0.01)
+    await flusher.close()
+
+    assert await submitted is True
+    finalize_many.assert_awaited_once()
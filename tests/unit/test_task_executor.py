@@ -0,0 +1,23 @@
+"""Unit tests for task executor."""
+
+import pytest
+
+from workflow_engine.core.task_executor import TaskExecutionError, activity_registry, execute_task
+from workflow_engine.dsl.schema import Task
+
+
+async def test_execute_task_locally_chains_activity_error(monkeypatch):
+    """Test a failing activity surfaces as TaskExecutionError with the original cause."""
+    error = ValueError("bad input")
+
+    async def failing_activity(**kwargs):
+        raise error
+
+    monkeypatch.setitem(activity_registry._activities, "failing", failing_activity)
+    task = Task(id="task1", name="Task 1", activity_type="failing", timeout="5s")
+
+    with pytest.raises(TaskExecutionError) as exc_info:
+        await execute_task(task, {}, {}, use_temporal=False)
+
+    assert exc_info.value.task_id == "task1"
+    assert exc_info.value.__cause__ is error
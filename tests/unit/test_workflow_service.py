@@ -7,7 +7,6 @@ from workflow_engine.api.services import WorkflowService
 from workflow_engine.storage.models import WorkflowDefinition, WorkflowExecutionStatus
 
 
-@pytest.mark.asyncio
 async def test_create_workflow(
     mock_workflow_repository,
     mock_execution_repository,
@@ -47,7 +46,6 @@ async def test_create_workflow(
     mock_workflow_repository.create.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_create_workflow_duplicate_name(
     mock_workflow_repository,
     mock_execution_repository,
@@ -75,7 +73,6 @@ async def test_create_workflow_duplicate_name(
         )
 
 
-@pytest.mark.asyncio
 async def test_execute_workflow(
     mock_workflow_repository,
     mock_execution_repository,
@@ -102,10 +99,68 @@ async def test_execute_workflow(
         parameters={},
     )
     mock_execution_repository.create.return_value = execution
-    mock_execution_repository.update.return_value = execution
 
     result = await service.execute_workflow(sample_workflow_db_model.id, {"param": "value"})
 
     assert result.workflow_definition_id == sample_workflow_db_model.id
     mock_workflow_executor.start_workflow.assert_called_once()
+    # The execution row is written once, already in RUNNING state
+    mock_execution_repository.create.assert_called_once()
+    created = mock_execution_repository.create.call_args[0][0]
+    assert created.status == WorkflowExecutionStatus.RUNNING
+    assert created.temporal_workflow_id == "temporal-workflow-id-123"
+    mock_execution_repository.update.assert_not_called()
 
+
+async def test_execute_workflow_reads_definition_fresh(
+    mock_workflow_repository,
+    mock_execution_repository,
+    mock_workflow_executor,
+    sample_workflow_db_model,
+):
+    """Test each start loads its definition from the database."""
+    service = WorkflowService(
+        mock_workflow_repository,
+        mock_execution_repository,
+        mock_workflow_executor,
+    )
+    mock_workflow_repository.get_by_id.return_value = sample_workflow_db_model
+
+    await service.execute_workflow(sample_workflow_db_model.id, {})
+    await service.execute_workflow(sample_workflow_db_model.id, {})
+
+    assert mock_workflow_repository.get_by_id.call_count == 2
+    assert mock_workflow_executor.start_workflow.call_count == 2
+
+
+async def test_register_workflows_batches_writes(
+    mock_workflow_repository,
+    mock_execution_repository,
+    mock_workflow_executor,
+    sample_workflow_db_model,
+    sample_workflow_definition,
+):
+    """Test register_workflows creates, updates and skips in one save."""
+    service = WorkflowService(
+        mock_workflow_repository,
+        mock_execution_repository,
+        mock_workflow_executor,
+    )
+    stored_yaml = sample_workflow_db_model.definition_yaml
+    mock_workflow_repository.get_by_names.return_value = [sample_workflow_db_model]
+    new_definition = sample_workflow_definition.model_copy(update={"name": "new-workflow"})
+
+    outcomes = await service.register_workflows([
+        (stored_yaml, sample_workflow_definition),
+        ("name: new-workflow\n", new_definition),
+    ])
+    assert outcomes == ["unchanged", "registered"]
+    mock_workflow_repository.save_all.assert_awaited_once()
+    (saved,) = mock_workflow_repository.save_all.await_args.args
+    assert [w.name for w in saved] == ["new-workflow"]
+
+    outcomes = await service.register_workflows([(stored_yaml + "\n# edited\n", sample_workflow_definition)])
+    assert outcomes == ["updated"]
+    assert sample_workflow_db_model.definition_yaml.endswith("# edited\n")
+    mock_workflow_repository.create.assert_not_called()
+    mock_workflow_repository.get_by_name.assert_not_called()
@@ -1,16 +1,21 @@
 """FastAPI application main file."""
 
+import logging
 import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from workflow_engine.api.routes import workflows, executions, approvals
 from workflow_engine.storage import database
-from workflow_engine.storage.database import init_db, Base
+from workflow_engine.storage.database import init_db, to_asyncpg_url, Base
 # Import models to ensure they're registered with Base.metadata
-from workflow_engine.storage.models import WorkflowDefinition, WorkflowExecution, ApprovalRequest, ApprovalRequest
+from workflow_engine.storage.models import WorkflowDefinition, WorkflowExecution, ApprovalRequest
 from workflow_engine.core.workflow_registry import register_all_workflows
+from workflow_engine.core.workflow_executor import TemporalWorkflowExecutor, create_temporal_client
+
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
@@ -23,23 +28,32 @@ async def lifespan(app: FastAPI):
     )
     async_database_url = os.getenv(
         "ASYNC_DATABASE_URL",
-        database_url.replace("postgresql://", "postgresql+asyncpg://"),
+        to_asyncpg_url(database_url),
     )
     
     init_db(database_url, async_database_url)
     
-    # Create tables automatically on startup
+    # Create tables automatically on startup unless AUTO_CREATE_TABLES=0
+    # (deployments whose schema is managed externally should disable this to
+    # skip the per-table existence checks create_all issues)
     # Access sync_engine from the module after init_db() has set it
-    if database.sync_engine:
+    if database.sync_engine and os.getenv("AUTO_CREATE_TABLES", "1") == "1":
         Base.metadata.create_all(bind=database.sync_engine)
     
     # Auto-register workflows from workflows directory
     registration_results = await register_all_workflows()
-    print(
-        f"Workflow registration: {registration_results['registered']} registered, "
-        f"{registration_results['updated']} updated, {registration_results['failed']} failed"
+    logger.info(
+        "Workflow registration: %d registered, %d updated, %d unchanged, %d failed",
+        registration_results["registered"],
+        registration_results["updated"],
+        registration_results["unchanged"],
+        registration_results["failed"],
     )
     
+    # Connect to Temporal once and share the client/executor across requests
+    app.state.temporal_client = await create_temporal_client()
+    app.state.workflow_executor = TemporalWorkflowExecutor(app.state.temporal_client)
+    
     yield
     
     # Shutdown
@@ -51,6 +65,7 @@ app = FastAPI(
     description="Core workflow engine with Temporal orchestration",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -2,16 +2,17 @@
 
 from typing import Optional
 from uuid import UUID
-from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 
 from workflow_engine.api.schemas import (
     ApprovalRequestResponse,
     ApprovalListResponse,
     ApprovalActionRequest,
+    APPROVAL_LIST_ADAPTER,
 )
-from workflow_engine.storage.models import ApprovalStatus
+from workflow_engine.storage.models import ApprovalStatus, utcnow
 from workflow_engine.storage.database import get_async_session
+from workflow_engine.storage.pagination import decode_cursor, encode_cursor
 from workflow_engine.storage.repositories import SQLAlchemyApprovalRepository
 
 router = APIRouter(prefix="/approvals", tags=["approvals"])
@@ -19,9 +20,8 @@ router = APIRouter(prefix="/approvals", tags=["approvals"])
 
 async def get_approval_repository():
     """Dependency to get approval repository."""
-    async for session in get_async_session():
+    async with get_async_session() as session:
         yield SQLAlchemyApprovalRepository(session)
-        break
 
 
 @router.get("", response_model=ApprovalListResponse)
@@ -30,23 +30,32 @@ async def list_approvals(
     execution_id: Optional[UUID] = Query(None, description="Filter by workflow execution ID"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page; takes precedence over skip"),
     repo: SQLAlchemyApprovalRepository = Depends(get_approval_repository),
 ):
     """List approval requests with optional filters."""
+    try:
+        before = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
     if status_filter == ApprovalStatus.PENDING and not execution_id:
         # Default to pending approvals if no specific filter
-        approvals = await repo.list_pending(skip=skip, limit=limit)
+        approvals = await repo.list_pending(skip=skip, limit=limit, before=before)
+        total = await repo.count_pending()
     elif execution_id:
-        approvals = await repo.list_by_execution_id(execution_id, skip=skip, limit=limit)
-        if status_filter:
-            approvals = [a for a in approvals if a.status == status_filter]
+        approvals = await repo.list_by_execution_id(
+            execution_id, status=status_filter, skip=skip, limit=limit, before=before
+        )
+        total = await repo.count_by_execution_id(execution_id, status=status_filter)
     else:
         # For now, just return pending if no filter
-        approvals = await repo.list_pending(skip=skip, limit=limit)
+        approvals = await repo.list_pending(skip=skip, limit=limit, before=before)
+        total = await repo.count_pending()
     
     return ApprovalListResponse(
-        approvals=[ApprovalRequestResponse.model_validate(a) for a in approvals],
-        total=len(approvals),
+        approvals=APPROVAL_LIST_ADAPTER.validate_python(approvals, from_attributes=True),
+        total=total,
+        next_cursor=encode_cursor(approvals, limit),
     )
 
 
@@ -74,13 +83,8 @@ async def approve_or_reject(
     # If approval not found or already resolved, try to find a pending one with similar ID
     # This handles the case where the base approval_id was used but a new one was created with execution ID appended
     if not approval or approval.status != ApprovalStatus.PENDING:
-        # Get all pending approvals and find one that starts with the requested approval_id
-        pending_approvals = await repo.list_pending(skip=0, limit=100)
-        matching_pending = None
-        for pending in pending_approvals:
-            if pending.approval_id.startswith(approval_id):
-                matching_pending = pending
-                break
+        # Find a pending approval whose approval_id starts with the requested approval_id
+        matching_pending = await repo.get_pending_by_prefix(approval_id)
         
         if matching_pending:
             approval = matching_pending
@@ -96,12 +100,14 @@ async def approve_or_reject(
     approval.status = ApprovalStatus.APPROVED if request.approved else ApprovalStatus.REJECTED
     approval.approved_by = request.approved_by
     approval.comment = request.comment
-    approval.responded_at = datetime.utcnow()
+    approval.responded_at = utcnow()
     
     approval = await repo.update(approval)
-    
-    # Explicitly commit the session to ensure changes are persisted
+    await repo.notify_updated(approval.approval_id)
+
+    # Commit before responding: the dependency's own commit runs after the
+    # response is sent, too late to turn a failed write into an error
     await repo.session.commit()
-    
+
     return ApprovalRequestResponse.model_validate(approval)
 
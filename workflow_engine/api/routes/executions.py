@@ -2,38 +2,37 @@
 
 from typing import Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
 
 from workflow_engine.api.schemas import (
     ExecutionCreateRequest,
     ExecutionResponse,
     ExecutionListResponse,
     ExecutionStatusResponse,
+    EXECUTION_LIST_ADAPTER,
 )
 from workflow_engine.api.services import WorkflowService
 from workflow_engine.storage.models import WorkflowExecutionStatus
 from workflow_engine.storage.database import get_async_session
+from workflow_engine.storage.pagination import decode_cursor, encode_cursor
 from workflow_engine.storage.repositories import (
     SQLAlchemyWorkflowRepository,
     SQLAlchemyExecutionRepository,
 )
-from workflow_engine.core.workflow_executor import TemporalWorkflowExecutor, create_temporal_client
 
 router = APIRouter(prefix="/executions", tags=["executions"])
 
 
-async def get_workflow_service():
+async def get_workflow_service(request: Request):
     """Dependency to get workflow service."""
-    async for session in get_async_session():
+    async with get_async_session() as session:
         workflow_repo = SQLAlchemyWorkflowRepository(session)
         execution_repo = SQLAlchemyExecutionRepository(session)
         
-        # Create Temporal client (in production, this should be a singleton)
-        temporal_client = await create_temporal_client()
-        workflow_executor = TemporalWorkflowExecutor(temporal_client)
+        # Reuse the application-wide executor created in the lifespan handler
+        workflow_executor = request.app.state.workflow_executor
         
         yield WorkflowService(workflow_repo, execution_repo, workflow_executor)
-        break
 
 
 @router.post("/workflows/{workflow_id}/execute", response_model=ExecutionResponse, status_code=status.HTTP_201_CREATED)
@@ -56,18 +55,26 @@ async def list_executions(
     status_filter: Optional[WorkflowExecutionStatus] = Query(None, alias="status", description="Filter by status"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page; takes precedence over skip"),
     service: WorkflowService = Depends(get_workflow_service),
 ):
     """List all executions with optional filters."""
+    try:
+        before = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
     executions = await service.list_executions(
         workflow_id=workflow_id,
         skip=skip,
         limit=limit,
         status=status_filter,
+        before=before,
     )
+    total = await service.count_executions(workflow_id=workflow_id, status=status_filter)
     return ExecutionListResponse(
-        executions=[ExecutionResponse.model_validate(e) for e in executions],
-        total=len(executions),
+        executions=EXECUTION_LIST_ADAPTER.validate_python(executions, from_attributes=True),
+        total=total,
+        next_cursor=encode_cursor(executions, limit),
     )
 
 
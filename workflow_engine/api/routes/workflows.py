@@ -2,13 +2,14 @@
 
 from typing import List
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
 from workflow_engine.api.schemas import (
     WorkflowCreateRequest,
     WorkflowUpdateRequest,
     WorkflowResponse,
     WorkflowListResponse,
+    WORKFLOW_LIST_ADAPTER,
 )
 from workflow_engine.api.services import WorkflowService
 from workflow_engine.storage.database import get_async_session
@@ -16,20 +17,18 @@ from workflow_engine.storage.repositories import (
     SQLAlchemyWorkflowRepository,
     SQLAlchemyExecutionRepository,
 )
-from workflow_engine.core.workflow_executor import TemporalWorkflowExecutor, create_temporal_client
 
 router = APIRouter(prefix="/workflows", tags=["workflows"])
 
 
-async def get_workflow_service():
+async def get_workflow_service(request: Request):
     """Dependency to get workflow service."""
-    async for session in get_async_session():
+    async with get_async_session() as session:
         workflow_repo = SQLAlchemyWorkflowRepository(session)
         execution_repo = SQLAlchemyExecutionRepository(session)
         
-        # Create Temporal client (in production, this should be a singleton)
-        temporal_client = await create_temporal_client()
-        workflow_executor = TemporalWorkflowExecutor(temporal_client)
+        # Reuse the application-wide executor created in the lifespan handler
+        workflow_executor = request.app.state.workflow_executor
         
         yield WorkflowService(workflow_repo, execution_repo, workflow_executor)
 
@@ -60,9 +59,10 @@ async def list_workflows(
 ):
     """List all workflow definitions."""
     workflows = await service.list_workflows(skip=skip, limit=limit)
+    total = await service.count_workflows()
     return WorkflowListResponse(
-        workflows=[WorkflowResponse.model_validate(w) for w in workflows],
-        total=len(workflows),
+        workflows=WORKFLOW_LIST_ADAPTER.validate_python(workflows, from_attributes=True),
+        total=total,
     )
 
 
@@ -3,7 +3,7 @@
 from typing import Optional, Dict, Any, List
 from uuid import UUID
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 from workflow_engine.storage.models import WorkflowExecutionStatus, ApprovalStatus
 
@@ -36,8 +36,7 @@ class WorkflowResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class WorkflowListResponse(BaseModel):
@@ -47,6 +46,10 @@ class WorkflowListResponse(BaseModel):
     total: int
 
 
+# Shared validators for list endpoints (one core schema reused across requests)
+WORKFLOW_LIST_ADAPTER = TypeAdapter(List[WorkflowResponse])
+
+
 # Execution Schemas
 class ExecutionCreateRequest(BaseModel):
     """Request to create/trigger an execution."""
@@ -65,12 +68,11 @@ class ExecutionResponse(BaseModel):
     parameters: Dict[str, Any]
     result: Optional[Dict[str, Any]]
     error: Optional[str]
-    started_at: Optional[datetime]
+    started_at: Optional[datetime]  # When Temporal accepted the run (API clock)
     completed_at: Optional[datetime]
-    created_at: datetime
+    created_at: datetime  # When the row was persisted (database clock), not when it was requested
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ExecutionListResponse(BaseModel):
@@ -78,6 +80,10 @@ class ExecutionListResponse(BaseModel):
 
     executions: List[ExecutionResponse]
     total: int
+    next_cursor: Optional[str] = None  # Pass as ``cursor`` to fetch the next page
+
+
+EXECUTION_LIST_ADAPTER = TypeAdapter(List[ExecutionResponse])
 
 
 class ExecutionStatusResponse(BaseModel):
@@ -90,8 +96,7 @@ class ExecutionStatusResponse(BaseModel):
     started_at: Optional[datetime]
     completed_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Approval Schemas
@@ -112,8 +117,7 @@ class ApprovalRequestResponse(BaseModel):
     responded_at: Optional[datetime]
     expires_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ApprovalListResponse(BaseModel):
@@ -121,6 +125,10 @@ class ApprovalListResponse(BaseModel):
 
     approvals: List[ApprovalRequestResponse]
     total: int
+    next_cursor: Optional[str] = None  # Pass as ``cursor`` to fetch the next page
+
+
+APPROVAL_LIST_ADAPTER = TypeAdapter(List[ApprovalRequestResponse])
 
 
 class ApprovalActionRequest(BaseModel):
@@ -1,18 +1,31 @@
 """Service layer for workflow operations."""
 
-from typing import Optional, Dict, Any
+import asyncio
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
 from uuid import UUID, uuid4
-from datetime import datetime
 
 from workflow_engine.dsl.parser import WorkflowParser
 from workflow_engine.dsl.validator import WorkflowValidator
 from workflow_engine.dsl.schema import WorkflowDefinition as DSLWorkflowDefinition
-from workflow_engine.storage.models import WorkflowDefinition, WorkflowExecution, WorkflowExecutionStatus
+from workflow_engine.storage.models import WorkflowDefinition, WorkflowExecution, WorkflowExecutionStatus, utcnow
+from workflow_engine.storage.pagination import PageCursor
 from workflow_engine.storage.repositories import WorkflowRepository, ExecutionRepository
 from workflow_engine.core.workflow_executor import WorkflowExecutor, TemporalWorkflowExecutor
 from workflow_engine.core.workflows import WorkflowEngineWorkflow
 
 
+@lru_cache(maxsize=256)
+def _parse_cached(yaml_text: str) -> Tuple[DSLWorkflowDefinition, Tuple[str, ...]]:
+    """Parse and validate workflow YAML, memoized on the YAML text.
+
+    Parse errors raise and are not cached. Callers must treat the returned
+    definition as read-only since it is shared between cache hits.
+    """
+    dsl_workflow = WorkflowParser.parse_yaml(yaml_text)
+    return dsl_workflow, tuple(WorkflowValidator.validate(dsl_workflow))
+
+
 class WorkflowService:
     """Service for workflow management."""
 
@@ -20,9 +33,12 @@ class WorkflowService:
         self,
         workflow_repo: WorkflowRepository,
         execution_repo: ExecutionRepository,
-        workflow_executor: WorkflowExecutor,
+        workflow_executor: Optional[WorkflowExecutor] = None,
     ):
-        """Initialize service with repositories and executor."""
+        """Initialize service with repositories and executor.
+
+        The executor is only needed to start and cancel executions.
+        """
         self.workflow_repo = workflow_repo
         self.execution_repo = execution_repo
         self.workflow_executor = workflow_executor
@@ -48,18 +64,21 @@ class WorkflowService:
         Raises:
             ValueError: If workflow definition is invalid
         """
-        # Parse and validate YAML
-        dsl_workflow = WorkflowParser.parse_yaml(definition_yaml)
-        errors = WorkflowValidator.validate(dsl_workflow)
+        # Look up an existing workflow with the same name while the YAML is
+        # parsed and validated off the event loop
+        existing_task = asyncio.create_task(self.workflow_repo.get_by_name(name))
+        try:
+            dsl_workflow, errors = await asyncio.to_thread(_parse_cached, definition_yaml)
+        finally:
+            existing = await existing_task
         if errors:
             raise ValueError(f"Invalid workflow definition: {', '.join(errors)}")
 
         # Check if workflow with same name exists
-        existing = await self.workflow_repo.get_by_name(name)
         if existing:
             raise ValueError(f"Workflow with name '{name}' already exists")
 
-        # Create database model
+        # Create database model (timestamps are set by the database)
         workflow_def = WorkflowDefinition(
             id=uuid4(),
             name=name,
@@ -67,8 +86,6 @@ class WorkflowService:
             description=description,
             definition_yaml=definition_yaml,
             definition_json=dsl_workflow.model_dump(),
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
         )
 
         return await self.workflow_repo.create(workflow_def)
@@ -81,6 +98,10 @@ class WorkflowService:
         """List all workflows."""
         return await self.workflow_repo.list_all(skip=skip, limit=limit)
 
+    async def count_workflows(self) -> int:
+        """Count all workflows."""
+        return await self.workflow_repo.count()
+
     async def update_workflow(
         self,
         workflow_id: UUID,
@@ -94,9 +115,8 @@ class WorkflowService:
             return None
 
         if definition_yaml:
-            # Parse and validate new YAML
-            dsl_workflow = WorkflowParser.parse_yaml(definition_yaml)
-            errors = WorkflowValidator.validate(dsl_workflow)
+            # Parse and validate new YAML off the event loop
+            dsl_workflow, errors = await asyncio.to_thread(_parse_cached, definition_yaml)
             if errors:
                 raise ValueError(f"Invalid workflow definition: {', '.join(errors)}")
 
@@ -108,10 +128,62 @@ class WorkflowService:
         if description is not None:
             workflow_def.description = description
 
-        workflow_def.updated_at = datetime.utcnow()
-
         return await self.workflow_repo.update(workflow_def)
 
+    async def register_workflows(
+        self,
+        definitions: List[Tuple[str, DSLWorkflowDefinition]],
+    ) -> List[str]:
+        """Create or update several workflows in one batch, matched by name.
+
+        Existing workflows are loaded with one query and all inserts and
+        updates are written in one flush. Workflows whose stored YAML is
+        identical are left untouched. A name repeated in ``definitions`` is
+        created once and then updated by its later occurrences.
+
+        Args:
+            definitions: (definition_yaml, parsed definition) pairs; the
+                definitions must already have passed validation
+
+        Returns:
+            "registered", "updated" or "unchanged" for each definition, in order
+        """
+        by_name = {
+            workflow.name: workflow
+            for workflow in await self.workflow_repo.get_by_names({dsl.name for _, dsl in definitions})
+        }
+        pending: Dict[UUID, WorkflowDefinition] = {}
+        outcomes: List[str] = []
+
+        for definition_yaml, dsl_workflow in definitions:
+            workflow_def = by_name.get(dsl_workflow.name)
+            if workflow_def is None:
+                workflow_def = WorkflowDefinition(
+                    id=uuid4(),
+                    name=dsl_workflow.name,
+                    version=dsl_workflow.version,
+                    description=dsl_workflow.description,
+                    definition_yaml=definition_yaml,
+                    definition_json=dsl_workflow.model_dump(),
+                )
+                by_name[dsl_workflow.name] = workflow_def
+                outcomes.append("registered")
+            elif workflow_def.definition_yaml == definition_yaml:
+                outcomes.append("unchanged")
+                continue
+            else:
+                workflow_def.version = dsl_workflow.version
+                if dsl_workflow.description is not None:
+                    workflow_def.description = dsl_workflow.description
+                workflow_def.definition_yaml = definition_yaml
+                workflow_def.definition_json = dsl_workflow.model_dump()
+                outcomes.append("updated")
+            pending[workflow_def.id] = workflow_def
+
+        if pending:
+            await self.workflow_repo.save_all(list(pending.values()))
+        return outcomes
+
     async def delete_workflow(self, workflow_id: UUID) -> bool:
         """Delete workflow definition."""
         return await self.workflow_repo.delete(workflow_id)
@@ -138,23 +210,22 @@ class WorkflowService:
         if not workflow_def:
             raise ValueError(f"Workflow not found: {workflow_id}")
 
-        # Parse workflow definition
-        dsl_workflow = WorkflowParser.parse_yaml(workflow_def.definition_yaml)
+        # Rebuild the DSL model from the stored parsed structure (skips YAML parsing)
+        dsl_workflow = DSLWorkflowDefinition.model_validate(workflow_def.definition_json)
 
-        # Create execution record
+        # Build the execution record in memory; it is persisted once below,
+        # after Temporal has accepted (or rejected) the workflow
+        execution_id = uuid4()
         execution = WorkflowExecution(
-            id=uuid4(),
+            id=execution_id,
             workflow_definition_id=workflow_id,
             workflow_definition_name=workflow_def.name,
             status=WorkflowExecutionStatus.PENDING,
             parameters=parameters,
-            created_at=datetime.utcnow(),
         )
 
-        execution = await self.execution_repo.create(execution)
-
         # Start Temporal workflow
-        temporal_workflow_id = f"workflow-{execution.id}"
+        temporal_workflow_id = f"workflow-{execution_id.hex}"
         try:
             result = await self.workflow_executor.start_workflow(
                 workflow_type=WorkflowEngineWorkflow,
@@ -162,19 +233,20 @@ class WorkflowService:
                 task_queue="workflow-engine",
                 args=(dsl_workflow, parameters),
             )
-
-            # Update execution with Temporal ID
-            execution.temporal_workflow_id = result
-            execution.status = WorkflowExecutionStatus.RUNNING
-            execution.started_at = datetime.utcnow()
-            await self.execution_repo.update(execution)
         except Exception as e:
             execution.status = WorkflowExecutionStatus.FAILED
             execution.error = str(e)
-            execution.completed_at = datetime.utcnow()
-            await self.execution_repo.update(execution)
+            execution.completed_at = utcnow()
+            await self.execution_repo.create(execution)
             raise ValueError(f"Failed to start workflow execution: {e}") from e
 
+        execution.temporal_workflow_id = result
+        execution.status = WorkflowExecutionStatus.RUNNING
+        # Application clock; created_at is stamped by the database at the insert
+        # below, so it records when the row was persisted and follows started_at
+        execution.started_at = utcnow()
+        execution = await self.execution_repo.create(execution)
+
         return execution
 
     async def get_execution(self, execution_id: UUID) -> Optional[WorkflowExecution]:
@@ -187,11 +259,22 @@ class WorkflowService:
         skip: int = 0,
         limit: int = 100,
         status: Optional[WorkflowExecutionStatus] = None,
+        before: Optional[PageCursor] = None,
     ) -> list[WorkflowExecution]:
-        """List executions."""
+        """List executions, newest first, optionally continuing after a keyset cursor."""
+        if workflow_id:
+            return await self.execution_repo.list_by_workflow(workflow_id, skip=skip, limit=limit, before=before)
+        return await self.execution_repo.list_all(skip=skip, limit=limit, status=status, before=before)
+
+    async def count_executions(
+        self,
+        workflow_id: Optional[UUID] = None,
+        status: Optional[WorkflowExecutionStatus] = None,
+    ) -> int:
+        """Count executions using the same filters as list_executions."""
         if workflow_id:
-            return await self.execution_repo.list_by_workflow(workflow_id, skip=skip, limit=limit)
-        return await self.execution_repo.list_all(skip=skip, limit=limit, status=status)
+            return await self.execution_repo.count(workflow_id=workflow_id)
+        return await self.execution_repo.count(status=status)
 
     async def cancel_execution(self, execution_id: UUID) -> Optional[WorkflowExecution]:
         """Cancel a running execution."""
@@ -209,6 +292,6 @@ class WorkflowService:
                 raise ValueError(f"Failed to cancel workflow: {e}") from e
 
         execution.status = WorkflowExecutionStatus.CANCELLED
-        execution.completed_at = datetime.utcnow()
+        execution.completed_at = utcnow()
         return await self.execution_repo.update(execution)
 
@@ -4,10 +4,54 @@ This module contains core activities like http_request, python_function, and hum
 Activities are automatically registered via the activities package __init__.py.
 """
 
+import asyncio
+import importlib.util
+import random
+import secrets
+import time
+import weakref
+from datetime import timedelta
+from uuid import UUID
+
 import httpx
+import orjson
 from typing import Any, Dict
 from temporalio import activity
 
+from workflow_engine.core import approval_events
+from workflow_engine.core.status_flusher import status_flusher
+from workflow_engine.storage.database import get_async_session, get_read_session
+from workflow_engine.storage.models import ApprovalRequest, ApprovalStatus, WorkflowExecutionStatus, utcnow
+from workflow_engine.storage.repositories import SQLAlchemyApprovalRepository, SQLAlchemyExecutionRepository
+
+# Shared HTTP clients, one per event loop, so activity calls reuse pooled
+# keep-alive connections instead of opening a new client per request.
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=100, max_connections=1000)
+# HTTP/2 multiplexes concurrent requests to the same host over one connection;
+# it needs the h2 package (httpx[http2]), so fall back to HTTP/1.1 without it
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+_BODYLESS_METHODS = frozenset({"GET", "HEAD"})
+_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get (or lazily create) the shared HTTP client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(http2=_HTTP2_AVAILABLE, limits=_HTTP_LIMITS)
+        _http_clients[loop] = client
+    return client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client for the running event loop, if any."""
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
 
 @activity.defn(name="http_request")
 async def http_request_activity(
@@ -22,18 +66,17 @@ async def http_request_activity(
             - headers: Request headers
             - body: Request body
             - timeout: Request timeout in seconds (default: 30.0)
+            - include_headers: Include response headers in the result (default: True)
             - simulate_failure: If True (in body or top-level), raises an exception (for testing)
 
+    The body is sent as JSON except for GET and HEAD requests, which never carry one.
+
     Returns:
         Response data
     """
-    url = args.get("url")
-    method = args.get("method", "GET")
-    headers = args.get("headers")
     body = args.get("body")
-    timeout = args.get("timeout", 30.0)
     
-    # Check for simulate_failure flag (can be in body or top-level args)
+    # Check for simulate_failure flag (can be in body or top-level args) before any other work
     simulate_failure = args.get("simulate_failure", False)
     if isinstance(body, dict):
         # Check body for simulate_failure (handles boolean True, string "true"/"True", etc.)
@@ -52,22 +95,28 @@ async def http_request_activity(
     if simulate_failure:
         raise ValueError("Simulated failure: simulate_failure flag was set to true")
     
-    if headers is None:
-        headers = {}
-
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        response = await client.request(
-            method=method.upper(),
-            url=url,
-            headers=headers,
-            json=body if body else None,
-        )
-        response.raise_for_status()
-        return {
-            "status_code": response.status_code,
-            "headers": dict(response.headers),
-            "body": response.json() if response.headers.get("content-type", "").startswith("application/json") else response.text,
-        }
+    url = args.get("url")
+    method = args.get("method", "GET").upper()
+    json_body = None if method in _BODYLESS_METHODS else (body or None)
+
+    client = _get_http_client()
+    response = await client.request(
+        method=method,
+        url=url,
+        headers=args.get("headers"),
+        json=json_body,
+        timeout=args.get("timeout", 30.0),
+    )
+    response.raise_for_status()
+    response_headers = response.headers
+    is_json = response_headers.get("content-type", "").startswith("application/json")
+    result = {
+        "status_code": response.status_code,
+        "body": orjson.loads(response.content) if is_json else response.text,
+    }
+    if args.get("include_headers", True):
+        result["headers"] = dict(response_headers)
+    return result
 
 
 @activity.defn(name="python_function")
@@ -88,14 +137,95 @@ async def python_function_activity(
     Returns:
         Function result
     """
-    function_name = args.get("function_name")
-    func_args = args.get("args")
-    func_kwargs = args.get("kwargs")
-    
     # This is a placeholder - in production, implement secure function execution
     raise NotImplementedError("Python function activities not yet implemented. Use http_request for now.")
 
 
+# Single-flight approval polling: one poller task per approval_id, shared by
+# every activity waiting on it, plus the number of waiters still attached.
+_approval_pollers: Dict[str, asyncio.Task] = {}
+_approval_waiter_counts: Dict[str, int] = {}
+
+# Approval poll backoff: first retry after _MIN_POLL_INTERVAL seconds, growing by
+# _POLL_BACKOFF per pending poll up to the activity's poll_interval, plus jitter
+_MIN_POLL_INTERVAL = 0.1
+_POLL_BACKOFF = 1.5
+_POLL_JITTER = 0.1
+
+
+async def _poll_approval(approval_id: str, poll_interval: float, deadline: float):
+    """Poll until the approval leaves PENDING or the ``time.monotonic()`` deadline passes.
+
+    Returns:
+        The (status, approved_by, responded_at, comment) row once decided,
+        or None if the deadline passed while still pending
+    """
+    # A NOTIFY from the API wakes the wait early; polling backs off from
+    # _MIN_POLL_INTERVAL up to poll_interval as a fallback
+    interval = min(_MIN_POLL_INTERVAL, poll_interval)
+    approval_events.subscribe(approval_id)
+    try:
+        while time.monotonic() < deadline:
+            try:
+                async with get_read_session() as session:
+                    approval_repo = SQLAlchemyApprovalRepository(session)
+                    approval = await approval_repo.get_status_for_poll(approval_id)
+                    
+                    if not approval:
+                        raise ValueError(f"Approval request '{approval_id}' not found")
+                    if approval.status != ApprovalStatus.PENDING:
+                        return approval
+                    # Still pending - nothing to commit, wait before next poll
+            except ValueError:
+                raise
+            except Exception:
+                # Log error but continue polling
+                pass
+            
+            # Wait before next poll (or until the approval is updated), with jitter
+            remaining = deadline - time.monotonic()
+            delay = interval + random.uniform(0, interval * _POLL_JITTER)
+            await approval_events.wait_for_update(approval_id, min(delay, max(remaining, 0)))
+            interval = min(interval * _POLL_BACKOFF, poll_interval)
+        return None
+    finally:
+        approval_events.unsubscribe(approval_id)
+
+
+async def _wait_for_approval_decision(approval_id: str, poll_interval: float, deadline: float):
+    """Wait on the shared poller for ``approval_id`` until decided or ``deadline``.
+
+    The poller is cancelled once its last waiter leaves. Each waiter stops at
+    its own deadline, even if the poller it joined runs longer; a waiter with a
+    later deadline starts a new poller when the running one gives up.
+    """
+    _approval_waiter_counts[approval_id] = _approval_waiter_counts.get(approval_id, 0) + 1
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            poller = _approval_pollers.get(approval_id)
+            if poller is None or poller.done():
+                poller = asyncio.create_task(_poll_approval(approval_id, poll_interval, deadline))
+                _approval_pollers[approval_id] = poller
+            # Shield so one waiter timing out or being cancelled does not
+            # cancel the shared poller
+            try:
+                approval = await asyncio.wait_for(asyncio.shield(poller), remaining)
+            except asyncio.TimeoutError:
+                return None
+            if approval is not None:
+                return approval
+    finally:
+        _approval_waiter_counts[approval_id] -= 1
+        if not _approval_waiter_counts[approval_id]:
+            del _approval_waiter_counts[approval_id]
+            poller = _approval_pollers.pop(approval_id, None)
+            if poller is not None and not poller.done():
+                poller.cancel()
+
+
 @activity.defn(name="human_approval")
 async def human_approval_activity(
     args: Dict[str, Any],
@@ -111,7 +241,7 @@ async def human_approval_activity(
             - title: Human-readable title for the approval request
             - description: Description of what needs approval
             - context: Additional context data (dict)
-            - poll_interval: How often to poll in seconds (default: 5s)
+            - poll_interval: Maximum seconds between polls; polling starts fast and backs off to this (default: 5s)
             - max_wait_time: Maximum time to wait in seconds (default: 1 hour)
             - workflow_execution_id: Optional workflow execution ID for linking
             - task_id: Optional task ID that requested approval
@@ -119,14 +249,6 @@ async def human_approval_activity(
     Returns:
         Approval result with status and optional comment
     """
-    import asyncio
-    import time
-    from datetime import datetime, timedelta
-    from uuid import UUID
-    from workflow_engine.storage.database import get_async_session
-    from workflow_engine.storage.models import ApprovalRequest, ApprovalStatus
-    from workflow_engine.storage.repositories import SQLAlchemyApprovalRepository
-    
     approval_id = args.get("approval_id")
     title = args.get("title")
     description = args.get("description")
@@ -142,40 +264,28 @@ async def human_approval_activity(
     # Make approval_id unique by appending execution_id if available
     # This ensures each workflow execution gets a unique approval_id
     # This prevents conflicts when multiple workflows use the same base approval_id
-    if workflow_execution_id and not approval_id.endswith(f"-{workflow_execution_id}"):
-        approval_id = f"{approval_id}-{workflow_execution_id}"
-    elif not workflow_execution_id:
-        # Fallback: if no execution_id available, append a UUID to ensure uniqueness
-        import uuid
-        approval_id = f"{approval_id}-{uuid.uuid4()}"
+    if workflow_execution_id:
+        execution_suffix = "-" + workflow_execution_id
+        if not approval_id.endswith(execution_suffix):
+            approval_id += execution_suffix
+    else:
+        # Fallback: if no execution_id available, append a random token to ensure uniqueness
+        approval_id = f"{approval_id}-{secrets.token_hex(8)}"
     
     title = title or f"Approval Request: {approval_id}"
     
     # Create approval request in database
-    async for session in get_async_session():
+    async with get_async_session() as session:
         approval_repo = SQLAlchemyApprovalRepository(session)
         
         # Look up execution by temporal_workflow_id to get the actual execution ID
         # The workflow_execution_id passed might be extracted from workflow ID, but we need the DB ID
-        from workflow_engine.storage.repositories import SQLAlchemyExecutionRepository
         execution_repo = SQLAlchemyExecutionRepository(session)
         current_execution_uuid = None
         
         if workflow_execution_id:
-            # Try to find execution by the extracted ID first
-            try:
-                execution = await execution_repo.get_by_id(UUID(workflow_execution_id))
-                if execution:
-                    current_execution_uuid = execution.id
-            except (ValueError, TypeError):
-                pass
-            
-            # If not found, try looking up by temporal_workflow_id
-            if not current_execution_uuid:
-                temporal_workflow_id = f"workflow-{workflow_execution_id}"
-                execution = await execution_repo.get_by_temporal_id(temporal_workflow_id)
-                if execution:
-                    current_execution_uuid = execution.id
+            # Match the extracted ID against the execution ID or its temporal_workflow_id
+            current_execution_uuid = await execution_repo.get_id_by_any(workflow_execution_id)
         
         # Check if approval already exists
         # Note: approval_id is already made unique above by appending execution_id
@@ -196,65 +306,34 @@ async def human_approval_activity(
                 title=title,
                 description=description,
                 context=context or {},
-                expires_at=datetime.utcnow() + timedelta(seconds=max_wait_time) if max_wait_time else None,
+                expires_at=utcnow() + timedelta(seconds=max_wait_time) if max_wait_time else None,
             )
             approval = await approval_repo.create(approval)
             await session.commit()
-        break
     
-    start_time = time.time()
+    deadline = time.monotonic() + max_wait_time
     
-    # Poll for approval status
-    while (time.time() - start_time) < max_wait_time:
-        try:
-            async for session in get_async_session():
-                approval_repo = SQLAlchemyApprovalRepository(session)
-                approval = await approval_repo.get_by_approval_id(approval_id)
-                
-                if not approval:
-                    raise ValueError(f"Approval request '{approval_id}' not found")
-                
-                # Check if approved or rejected
-                if approval.status == ApprovalStatus.APPROVED:
-                    await session.commit()
-                    return {
-                        "status": "approved",
-                        "approval_id": approval_id,
-                        "approved_by": approval.approved_by,
-                        "approved_at": approval.responded_at.isoformat() if approval.responded_at else None,
-                        "comment": approval.comment,
-                    }
-                elif approval.status == ApprovalStatus.REJECTED:
-                    await session.commit()
-                    raise ValueError(
-                        f"Approval rejected: {approval.comment or 'No comment provided'}"
-                    )
-                elif approval.status == ApprovalStatus.TIMEOUT:
-                    await session.commit()
-                    raise TimeoutError(f"Approval timed out: {approval_id}")
-                
-                # Still pending - wait before next poll
-                await session.commit()
-                break
-        except (ValueError, TimeoutError):
-            raise
-        except Exception:
-            # Log error but continue polling
-            pass
-        
-        # Wait before next poll
-        await asyncio.sleep(poll_interval)
+    # Wait for a decision; concurrent waiters on the same approval_id share one poller
+    approval = await _wait_for_approval_decision(approval_id, poll_interval, deadline)
+    if approval is not None:
+        if approval.status == ApprovalStatus.APPROVED:
+            return {
+                "status": "approved",
+                "approval_id": approval_id,
+                "approved_by": approval.approved_by,
+                "approved_at": approval.responded_at.isoformat() if approval.responded_at else None,
+                "comment": approval.comment,
+            }
+        elif approval.status == ApprovalStatus.REJECTED:
+            raise ValueError(
+                f"Approval rejected: {approval.comment or 'No comment provided'}"
+            )
+        raise TimeoutError(f"Approval timed out: {approval_id}")
     
     # Timeout - mark as timeout and raise error
-    async for session in get_async_session():
+    async with get_async_session() as session:
         approval_repo = SQLAlchemyApprovalRepository(session)
-        approval = await approval_repo.get_by_approval_id(approval_id)
-        if approval and approval.status == ApprovalStatus.PENDING:
-            approval.status = ApprovalStatus.TIMEOUT
-            approval.responded_at = datetime.utcnow()
-            await approval_repo.update(approval)
-            await session.commit()
-        break
+        await approval_repo.mark_timeout(approval_id, utcnow())
     
     raise TimeoutError(
         f"Approval timeout: approval_id '{approval_id}' not approved within {max_wait_time}s"
@@ -277,12 +356,6 @@ async def update_execution_status_activity(
             - result: Optional workflow result (dict)
             - error: Optional error message (string)
     """
-    from datetime import datetime
-    from uuid import UUID
-    from workflow_engine.storage.database import get_async_session
-    from workflow_engine.storage.models import WorkflowExecutionStatus
-    from workflow_engine.storage.repositories import SQLAlchemyExecutionRepository
-    
     execution_id_str = args.get("execution_id")
     status_str = args.get("status")
     result = args.get("result")
@@ -304,27 +377,15 @@ async def update_execution_status_activity(
     except ValueError:
         raise ValueError(f"Invalid status: {status_str}")
     
-    async for session in get_async_session():
-        execution_repo = SQLAlchemyExecutionRepository(session)
-        
-        # Update execution status
-        updated = await execution_repo.update_status(
-            execution_id=execution_id,
-            status=status,
-            result=result,
-            error=error,
-        )
-        
-        if not updated:
-            raise ValueError(f"Execution not found: {execution_id}")
-        
-        # Also update completed_at timestamp if status is terminal
-        if status in [WorkflowExecutionStatus.COMPLETED, WorkflowExecutionStatus.FAILED, WorkflowExecutionStatus.CANCELLED]:
-            execution = await execution_repo.get_by_id(execution_id)
-            if execution and not execution.completed_at:
-                execution.completed_at = datetime.utcnow()
-                await execution_repo.update(execution)
-        
-        await session.commit()
-        break
+    # Queued with other workflows finishing now and written in one transaction;
+    # returns once the update is committed
+    updated = await status_flusher.submit(
+        execution_id=execution_id,
+        status=status,
+        result=result,
+        error=error,
+    )
+
+    if not updated:
+        raise ValueError(f"Execution not found: {execution_id}")
 
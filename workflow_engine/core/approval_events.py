@@ -0,0 +1,91 @@
+"""Wake-ups for activities waiting on human approvals.
+
+The API records approve/reject decisions with ``NOTIFY approval_updates``
+(see ``SQLAlchemyApprovalRepository.notify_updated``). Worker processes run
+``listen_for_approval_updates`` to turn those notifications into in-process
+``asyncio.Event`` signals, so a waiting ``human_approval`` activity re-checks
+the database immediately instead of sleeping out its poll interval. Polling
+remains the fallback if the listener is not running.
+"""
+
+import asyncio
+import logging
+from typing import Dict
+
+from workflow_engine.storage import database
+from workflow_engine.storage.repositories.approval_repository import APPROVAL_CHANNEL
+
+log = logging.getLogger(__name__)
+
+# Reconnect delay and liveness check interval for the listener connection
+_LISTENER_RETRY_SECONDS = 5.0
+_LISTENER_CHECK_SECONDS = 30.0
+
+_approval_events: Dict[str, asyncio.Event] = {}
+
+
+def subscribe(approval_id: str) -> asyncio.Event:
+    """Get the wake-up event for an approval, creating it if needed."""
+    return _approval_events.setdefault(approval_id, asyncio.Event())
+
+
+def unsubscribe(approval_id: str) -> None:
+    """Drop the wake-up event for an approval."""
+    _approval_events.pop(approval_id, None)
+
+
+def notify(approval_id: str) -> None:
+    """Wake any activity in this process waiting on the given approval."""
+    event = _approval_events.get(approval_id)
+    if event is not None:
+        event.set()
+
+
+async def wait_for_update(approval_id: str, timeout: float) -> bool:
+    """Wait until the approval is signalled or ``timeout`` seconds pass.
+
+    Returns:
+        True if woken by a notification, False on timeout
+    """
+    event = subscribe(approval_id)
+    try:
+        await asyncio.wait_for(event.wait(), timeout=timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+    finally:
+        event.clear()
+
+
+def _on_notification(connection, pid, channel, payload) -> None:
+    """asyncpg listener callback; the payload is the approval_id."""
+    notify(payload)
+
+
+async def listen_for_approval_updates() -> None:
+    """Relay ``approval_updates`` notifications to waiting activities.
+
+    Holds one dedicated connection from the async engine and reconnects if
+    it drops. Runs until cancelled.
+    """
+    if database.async_engine is None:
+        log.info("No async database engine; approval waits will poll only")
+        return
+
+    while True:
+        try:
+            async with database.async_engine.connect() as conn:
+                raw_connection = await conn.get_raw_connection()
+                driver_connection = raw_connection.driver_connection
+                await driver_connection.add_listener(APPROVAL_CHANNEL, _on_notification)
+                try:
+                    while not driver_connection.is_closed():
+                        await asyncio.sleep(_LISTENER_CHECK_SECONDS)
+                finally:
+                    if not driver_connection.is_closed():
+                        await driver_connection.remove_listener(APPROVAL_CHANNEL, _on_notification)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            log.warning("Approval listener connection failed, retrying: %s", e)
+        await asyncio.sleep(_LISTENER_RETRY_SECONDS)
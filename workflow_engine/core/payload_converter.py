@@ -0,0 +1,119 @@
+"""orjson-backed Temporal data converter.
+
+Writes ``json/plain`` payloads that decode to the same values as Temporal's
+default converter, so clients and workers using either converter
+interoperate, but encodes and decodes them with orjson. The bytes can still
+differ: non-ASCII text is written as raw UTF-8 instead of ``\\u`` escapes.
+
+Where orjson would give a different result, the default ``json`` path is
+used instead:
+
+- integers wider than 64 bits, which orjson cannot encode and decodes as floats
+- NaN and infinities, which orjson encodes as ``null`` and cannot decode
+"""
+
+import dataclasses
+import math
+import re
+from typing import Any, Optional
+
+import orjson
+import pydantic
+import temporalio.api.common.v1
+from temporalio.converter import (
+    AdvancedJSONEncoder,
+    CompositePayloadConverter,
+    DataConverter,
+    DefaultPayloadConverter,
+    JSONPlainPayloadConverter,
+    value_to_type,
+)
+
+# Matches json.dumps(sort_keys=True) and its str() conversion of non-string keys.
+# Dataclasses go through AdvancedJSONEncoder (asdict) so their keys are sorted too.
+_ORJSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+
+# A run of 20 digits may be an integer beyond 64 bits, which orjson.loads would
+# turn into a float; such payloads are decoded with json (false positives,
+# e.g. digits inside strings, only cost the slower path)
+_WIDE_NUMBER_RE = re.compile(rb"\d{20}")
+
+
+def _has_non_finite_float(value: Any) -> bool:
+    """Whether ``value`` contains a NaN or infinite float anywhere inside it."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite_float(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite_float(item) for item in value)
+    if isinstance(value, pydantic.BaseModel):
+        return any(_has_non_finite_float(item) for item in value.__dict__.values())
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return any(_has_non_finite_float(getattr(value, field.name)) for field in dataclasses.fields(value))
+    return False
+
+
+class ORJSONPlainPayloadConverter(JSONPlainPayloadConverter):
+    """``json/plain`` payload converter using orjson.
+
+    Values orjson cannot serialize natively (e.g. Pydantic models, sets,
+    dataclasses) fall back to Temporal's ``AdvancedJSONEncoder`` handling;
+    values orjson would encode differently use the base class's ``json`` path.
+    """
+
+    def __init__(self) -> None:
+        """Initialize converter."""
+        super().__init__()
+        self._fallback_default = AdvancedJSONEncoder().default
+
+    def to_payload(self, value: Any) -> Optional[temporalio.api.common.v1.Payload]:
+        """See base class."""
+        try:
+            data = orjson.dumps(value, default=self._fallback_default, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # e.g. an integer wider than 64 bits; json raises for truly unsupported values
+            return super().to_payload(value)
+        # orjson writes NaN and infinities as null; only such payloads contain one
+        if b"null" in data and _has_non_finite_float(value):
+            return super().to_payload(value)
+        return temporalio.api.common.v1.Payload(
+            metadata={"encoding": self.encoding.encode()},
+            data=data,
+        )
+
+    def from_payload(
+        self,
+        payload: temporalio.api.common.v1.Payload,
+        type_hint: Optional[type] = None,
+    ) -> Any:
+        """See base class."""
+        if _WIDE_NUMBER_RE.search(payload.data):
+            return super().from_payload(payload, type_hint)
+        try:
+            obj = orjson.loads(payload.data)
+        except orjson.JSONDecodeError:
+            # NaN and Infinity from json payloads; json also reports truly invalid data
+            return super().from_payload(payload, type_hint)
+        if type_hint:
+            obj = value_to_type(type_hint, obj, self._custom_type_converters)
+        return obj
+
+
+class ORJSONPayloadConverter(CompositePayloadConverter):
+    """Temporal's default payload converter chain with the JSON step swapped for orjson."""
+
+    def __init__(self) -> None:
+        """Initialize converter."""
+        super().__init__(
+            *(
+                ORJSONPlainPayloadConverter() if isinstance(converter, JSONPlainPayloadConverter) else converter
+                for converter in DefaultPayloadConverter.default_encoding_payload_converters
+            )
+        )
+
+
+ORJSON_DATA_CONVERTER = dataclasses.replace(
+    DataConverter.default,
+    payload_converter_class=ORJSONPayloadConverter,
+)
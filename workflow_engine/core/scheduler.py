@@ -0,0 +1,93 @@
+"""Dependency-ordered task scheduling."""
+
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+from workflow_engine.dsl.graph import analyze_workflow
+from workflow_engine.dsl.schema import Task
+
+
+def build_dependency_graph(tasks: Iterable[Task]) -> Tuple[Dict[str, List[str]], Dict[str, int]]:
+    """Build the reverse adjacency list and indegree of each task.
+
+    Args:
+        tasks: Workflow tasks
+
+    Returns:
+        Tuple of (dependents, indegree): the IDs of the tasks depending on
+        each task, and the number of distinct dependencies of each task
+    """
+    graph = analyze_workflow(tasks)
+    return graph.dependents, graph.in_degree
+
+
+class DependencyScheduler:
+    """Tracks which tasks are ready to run as their dependencies complete.
+
+    The dependency graph is built once; completing a task only visits its
+    dependents, so scheduling a whole workflow is linear in tasks plus edges
+    instead of rescanning every task after each completion.
+    """
+
+    def __init__(
+        self,
+        tasks: Iterable[Task],
+        graph: Optional[Tuple[Dict[str, List[str]], Dict[str, int]]] = None,
+    ):
+        """Initialize scheduler.
+
+        Args:
+            tasks: Workflow tasks
+            graph: Result of ``build_dependency_graph`` for these tasks, if
+                already built; it is not modified
+        """
+        tasks = list(tasks)
+        self.task_by_id: Dict[str, Task] = {task.id: task for task in tasks}
+        if graph is None:
+            self._dependents, self._indegree = build_dependency_graph(tasks)
+        else:
+            self._dependents, self._indegree = graph[0], dict(graph[1])
+        self._ready: Deque[Task] = deque(task for task in tasks if self._indegree[task.id] == 0)
+        self._remaining = len(self.task_by_id)
+
+    @property
+    def remaining(self) -> int:
+        """Number of tasks not yet completed."""
+        return self._remaining
+
+    def has_ready(self) -> bool:
+        """Check whether any task is ready to run."""
+        return bool(self._ready)
+
+    def pop_ready(self) -> Task:
+        """Take the next ready task.
+
+        Raises:
+            IndexError: If no task is ready
+        """
+        return self._ready.popleft()
+
+    def drain_ready(self) -> List[Task]:
+        """Take all tasks that are currently ready."""
+        ready = list(self._ready)
+        self._ready.clear()
+        return ready
+
+    def mark_completed(self, task_id: str) -> List[Task]:
+        """Record a completed task and queue dependents that became ready.
+
+        Args:
+            task_id: ID of the completed task
+
+        Returns:
+            Tasks that became ready because of this completion
+        """
+        self._remaining -= 1
+        newly_ready = []
+        indegree = self._indegree
+        for dependent_id in self._dependents.get(task_id, ()):
+            indegree[dependent_id] -= 1
+            if indegree[dependent_id] == 0:
+                newly_ready.append(self.task_by_id[dependent_id])
+        self._ready.extend(newly_ready)
+        return newly_ready
@@ -1,8 +1,9 @@
 """Workflow state machine for managing execution states."""
 
+from collections.abc import Sequence
 from enum import Enum
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timezone
 
 
 class WorkflowState(str, Enum):
@@ -25,6 +26,10 @@ class TaskState(str, Enum):
     SKIPPED = "SKIPPED"
 
 
+# Shared empty transition set (terminal states and unknown states)
+_EMPTY_TRANSITIONS: frozenset = frozenset()
+
+
 class StateTransition:
     """Represents a state transition."""
 
@@ -37,32 +42,51 @@ class StateTransition:
         """Initialize state transition."""
         self.from_state = from_state
         self.to_state = to_state
-        self.timestamp = timestamp or datetime.utcnow()
+        # Naive UTC, like the rest of the engine's timestamps
+        self.timestamp = timestamp or datetime.now(timezone.utc).replace(tzinfo=None)
 
     def __repr__(self) -> str:
         return f"<StateTransition({self.from_state} -> {self.to_state} at {self.timestamp})>"
 
 
+class _ReadOnlyList(Sequence):
+    """Read-only view over a list; reflects later appends without copying."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: list):
+        self._data = data
+
+    def __getitem__(self, index):
+        return self._data[index]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"_ReadOnlyList({self._data!r})"
+
+
 class WorkflowStateMachine:
     """State machine for workflow execution."""
 
     # Valid state transitions
     VALID_TRANSITIONS = {
-        WorkflowState.PENDING: [WorkflowState.RUNNING, WorkflowState.CANCELLED],
-        WorkflowState.RUNNING: [WorkflowState.COMPLETED, WorkflowState.FAILED, WorkflowState.CANCELLED],
-        WorkflowState.COMPLETED: [],  # Terminal state
-        WorkflowState.FAILED: [WorkflowState.RUNNING],  # Can retry
-        WorkflowState.CANCELLED: [],  # Terminal state
+        WorkflowState.PENDING: frozenset({WorkflowState.RUNNING, WorkflowState.CANCELLED}),
+        WorkflowState.RUNNING: frozenset({WorkflowState.COMPLETED, WorkflowState.FAILED, WorkflowState.CANCELLED}),
+        WorkflowState.COMPLETED: _EMPTY_TRANSITIONS,  # Terminal state
+        WorkflowState.FAILED: frozenset({WorkflowState.RUNNING}),  # Can retry
+        WorkflowState.CANCELLED: _EMPTY_TRANSITIONS,  # Terminal state
     }
 
     def __init__(self, initial_state: WorkflowState = WorkflowState.PENDING):
         """Initialize state machine."""
         self.current_state = initial_state
-        self.transitions: list[StateTransition] = []
+        self._transitions: list[StateTransition] = []
 
     def can_transition(self, to_state: WorkflowState) -> bool:
         """Check if transition to target state is valid."""
-        return to_state in self.VALID_TRANSITIONS.get(self.current_state, [])
+        return to_state in self.VALID_TRANSITIONS.get(self.current_state, _EMPTY_TRANSITIONS)
 
     def transition(self, to_state: WorkflowState) -> bool:
         """Transition to new state if valid.
@@ -74,7 +98,7 @@ class WorkflowStateMachine:
             return False
 
         transition = StateTransition(self.current_state, to_state)
-        self.transitions.append(transition)
+        self._transitions.append(transition)
         self.current_state = to_state
         return True
 
@@ -82,7 +106,6 @@ class WorkflowStateMachine:
         """Get current state."""
         return self.current_state
 
-    def get_transitions(self) -> list[StateTransition]:
-        """Get all state transitions."""
-        return self.transitions.copy()
-
+    def get_transitions(self) -> Sequence[StateTransition]:
+        """Get all state transitions as a read-only view (use ``list()`` for a copy)."""
+        return _ReadOnlyList(self._transitions)
@@ -0,0 +1,147 @@
+"""Batched writes of final workflow execution statuses.
+
+Every workflow ends with an ``update_execution_status`` activity. Under load,
+many of them finish at roughly the same time, and writing each in its own
+session and transaction costs a connection checkout and a commit apiece.
+``StatusFlusher`` queues those updates in the worker process and writes
+whatever has accumulated within a short window in one transaction via
+``SQLAlchemyExecutionRepository.finalize_many``. Each caller still waits
+until its update is committed, so activity completion keeps meaning the
+status is durable.
+"""
+
+import asyncio
+import logging
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from workflow_engine.storage import database
+from workflow_engine.storage.models import WorkflowExecutionStatus
+from workflow_engine.storage.repositories import SQLAlchemyExecutionRepository
+
+log = logging.getLogger(__name__)
+
+# Queued update plus the future its submitter is waiting on
+_Pending = Tuple[Tuple[UUID, WorkflowExecutionStatus, Optional[dict], Optional[str]], asyncio.Future]
+
+# Queued by close(): the writer flushes what it holds and exits when it sees this
+_STOP = object()
+
+
+class StatusFlusher:
+    """Coalesces execution status updates into batched database writes."""
+
+    def __init__(self, max_batch: int = 100, interval: float = 0.05):
+        """Initialize flusher.
+
+        Args:
+            max_batch: Maximum number of updates written per transaction
+            interval: Seconds to wait for more updates after the first one
+                of a batch arrives
+        """
+        self.max_batch = max_batch
+        self.interval = interval
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _ensure_running(self) -> asyncio.Queue:
+        """Start the background writer on the running loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._task is None or self._task.done():
+            # Queues and tasks are bound to a loop; start afresh on a new one
+            self._queue = asyncio.Queue()
+            self._loop = loop
+            self._task = loop.create_task(self._run())
+        return self._queue
+
+    async def submit(
+        self,
+        execution_id: UUID,
+        status: WorkflowExecutionStatus,
+        result: Optional[dict] = None,
+        error: Optional[str] = None,
+    ) -> bool:
+        """Queue a status update and wait until it is committed.
+
+        Args:
+            execution_id: Execution ID
+            status: New status
+            result: Workflow result; None keeps the stored value
+            error: Error message; None keeps the stored value
+
+        Returns:
+            True if the execution exists and was updated, False otherwise
+        """
+        queue = self._ensure_running()
+        fut = asyncio.get_running_loop().create_future()
+        queue.put_nowait(((execution_id, status, result, error), fut))
+        return await fut
+
+    async def _run(self) -> None:
+        """Write queued updates in batches until ``_STOP`` is dequeued."""
+        queue = self._queue
+        batch: List[_Pending] = []
+        stopping = False
+        try:
+            while not stopping:
+                item = await queue.get()
+                if item is _STOP:
+                    return
+                batch.append(item)
+                # Give concurrent finishers a moment to join this batch
+                await asyncio.sleep(self.interval)
+                while len(batch) < self.max_batch and not queue.empty():
+                    item = queue.get_nowait()
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    batch.append(item)
+                await self._flush(batch)
+                batch = []
+        except asyncio.CancelledError:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.cancel()
+            raise
+
+    @staticmethod
+    async def _flush(batch: List[_Pending]) -> None:
+        """Write one batch and resolve its futures."""
+        try:
+            async with database.get_async_session() as session:
+                found = await SQLAlchemyExecutionRepository(session).finalize_many(
+                    [update for update, _ in batch]
+                )
+        except Exception as e:
+            log.warning("Failed to write %d execution status updates: %s", len(batch), e)
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+        for update, fut in batch:
+            if not fut.done():
+                fut.set_result(update[0] in found)
+
+    async def close(self) -> None:
+        """Stop the background writer once it has written every queued update."""
+        task, queue = self._task, self._queue
+        self._task = self._queue = self._loop = None
+        if task is None:
+            return
+        if not task.done():
+            # Updates queued before the marker, including any batch the writer
+            # is holding, are flushed before it exits
+            queue.put_nowait(_STOP)
+            await task
+        remaining: List[_Pending] = []
+        while not queue.empty():
+            item = queue.get_nowait()
+            if item is not _STOP:
+                remaining.append(item)
+        for start in range(0, len(remaining), self.max_batch):
+            await self._flush(remaining[start:start + self.max_batch])
+
+
+# Shared by the activities of this worker process
+status_flusher = StatusFlusher()
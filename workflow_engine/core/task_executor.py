@@ -2,39 +2,33 @@
 
 import asyncio
 import inspect
-from typing import Any, Dict, Optional
+import sys
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import timedelta
 
+# Timeout context manager: arms a loop callback instead of wrapping the awaitable in a Task
+if sys.version_info >= (3, 11):
+    from asyncio import timeout as async_timeout
+else:
+    from async_timeout import timeout as async_timeout
+
 from temporalio import activity, workflow
 from temporalio.common import RetryPolicy
-from temporalio.exceptions import ActivityError
 
+from workflow_engine.dsl.durations import parse_duration  # noqa: F401 (re-exported)
 from workflow_engine.dsl.schema import Task, RetryPolicy as DSLRetryPolicy
 
+# Activity start-to-close timeout when a task or compensation does not set one
+DEFAULT_ACTIVITY_TIMEOUT = timedelta(hours=1)
 
-def parse_duration(duration_str: str) -> timedelta:
-    """Parse duration string to timedelta.
-
-    Args:
-        duration_str: Duration string (e.g., "5s", "10m", "1h")
-
-    Returns:
-        timedelta object
-    """
-    if not duration_str:
-        raise ValueError("Duration string cannot be empty")
 
-    unit = duration_str[-1]
-    value = float(duration_str[:-1])
+class TaskExecutionError(RuntimeError):
+    """A task's activity raised; the original exception is chained as ``__cause__``."""
 
-    if unit == "s":
-        return timedelta(seconds=value)
-    elif unit == "m":
-        return timedelta(minutes=value)
-    elif unit == "h":
-        return timedelta(hours=value)
-    else:
-        raise ValueError(f"Invalid duration unit: {unit}. Use s, m, or h")
+    def __init__(self, task_id: str):
+        """Initialize error for the given task."""
+        super().__init__(f"Task '{task_id}' failed")
+        self.task_id = task_id
 
 
 def dsl_retry_to_temporal(dsl_retry: Optional[DSLRetryPolicy]) -> Optional[RetryPolicy]:
@@ -49,15 +43,7 @@ def dsl_retry_to_temporal(dsl_retry: Optional[DSLRetryPolicy]) -> Optional[Retry
     if not dsl_retry:
         return None
 
-    initial_interval = parse_duration(dsl_retry.initial_interval)
-    max_interval = parse_duration(dsl_retry.max_interval)
-
-    return RetryPolicy(
-        initial_interval=initial_interval,
-        backoff_coefficient=dsl_retry.multiplier,
-        maximum_interval=max_interval,
-        maximum_attempts=dsl_retry.max_attempts,
-    )
+    return dsl_retry.to_temporal()
 
 
 class ActivityRegistry:
@@ -66,7 +52,9 @@ class ActivityRegistry:
     def __init__(self):
         """Initialize activity registry."""
         self._activities: Dict[str, Any] = {}
-        self._temporal_activities: list = []  # Track Temporal activity functions for worker
+        # Track Temporal activity functions for worker, keyed by id() for O(1) dedup
+        self._temporal_activities: Dict[int, Any] = {}
+        self._temporal_activities_snapshot: Tuple[Any, ...] = ()  # Rebuilt on register, shared by readers
 
     def register(self, activity_type: str, activity_func: Any) -> None:
         """Register an activity function.
@@ -77,8 +65,9 @@ class ActivityRegistry:
         """
         self._activities[activity_type] = activity_func
         # Track Temporal activity functions for auto-discovery in worker
-        if activity_func not in self._temporal_activities:
-            self._temporal_activities.append(activity_func)
+        if id(activity_func) not in self._temporal_activities:
+            self._temporal_activities[id(activity_func)] = activity_func
+            self._temporal_activities_snapshot = tuple(self._temporal_activities.values())
 
     def get(self, activity_type: str) -> Any:
         """Get activity function by type.
@@ -96,6 +85,17 @@ class ActivityRegistry:
             raise KeyError(f"Activity type '{activity_type}' not found in registry")
         return self._activities[activity_type]
 
+    def resolve(self, activity_type: str) -> Optional[Any]:
+        """Get activity function by type in a single lookup.
+
+        Args:
+            activity_type: Type identifier
+
+        Returns:
+            Activity function, or None if not registered
+        """
+        return self._activities.get(activity_type)
+
     def has(self, activity_type: str) -> bool:
         """Check if activity type is registered.
 
@@ -107,20 +107,20 @@ class ActivityRegistry:
         """
         return activity_type in self._activities
 
-    def get_all_temporal_activities(self) -> list:
+    def get_all_temporal_activities(self) -> Tuple[Any, ...]:
         """Get all registered Temporal activity functions for worker.
 
         Returns:
-            List of Temporal activity functions
+            Immutable snapshot of the Temporal activity functions
         """
-        return self._temporal_activities.copy()
+        return self._temporal_activities_snapshot
 
 
 # Global activity registry
 activity_registry = ActivityRegistry()
 
 
-def auto_register_activities(activities_module) -> None:
+def auto_register_activities(activities_module) -> List[str]:
     """Auto-register all activities decorated with @activity.defn in a module.
     
     Scans the module for functions decorated with @activity.defn and automatically
@@ -128,33 +128,31 @@ def auto_register_activities(activities_module) -> None:
     
     Args:
         activities_module: The module containing activity functions
+    
+    Returns:
+        Names of the activities registered from this module
     """
-    registered_count = 0
-    method1_found = []
+    registered_names: List[str] = []
     
     # Method 1: Check all callables in module for __temporal_activity__ / __temporal_activity_definition attribute
-    for name in dir(activities_module):
-        if name.startswith('_'):
+    # (@activity.defn stores it in the function's __dict__, so look there directly)
+    for name, obj in vars(activities_module).items():
+        if name[0] == '_' or not obj or not callable(obj):
             continue
-        obj = getattr(activities_module, name, None)
-        if not obj or not callable(obj):
+        obj_dict = getattr(obj, '__dict__', None)
+        if not obj_dict:
             continue
         
         # Check for Temporal activity definitions
-        activity_info = None
-        if hasattr(obj, '__temporal_activity__'):
-            activity_info = getattr(obj, '__temporal_activity__')
-        elif hasattr(obj, '__temporal_activity_definition'):
-            activity_info = getattr(obj, '__temporal_activity_definition')
+        activity_info = obj_dict.get('__temporal_activity__') or obj_dict.get('__temporal_activity_definition')
 
         if activity_info:
             activity_name = getattr(activity_info, 'name', None) or name
             activity_registry.register(activity_name, obj)
-            registered_count += 1
-            method1_found.append(activity_name)
+            registered_names.append(activity_name)
     
     # Method 2: If no activities found, try known function names and check their decorator
-    if registered_count == 0:
+    if not registered_names:
         # Known activity function names and their registered names
         activity_mappings = {
             'http_request_activity': 'http_request',
@@ -167,52 +165,63 @@ def auto_register_activities(activities_module) -> None:
                 func = getattr(activities_module, func_name)
                 if callable(func):
                     activity_registry.register(activity_name, func)
-                    registered_count += 1
+                    registered_names.append(activity_name)
+    
+    return registered_names
 
 
 async def execute_task(
     task: Task,
     task_config: Dict[str, Any],
     workflow_params: Dict[str, Any],
+    use_temporal: bool = True,
 ) -> Any:
     """Execute a task with retry and timeout handling.
 
+    From workflow code the activity is scheduled through Temporal, which
+    enforces the timeout and retry policy server-side. With
+    ``use_temporal=False`` the activity function is awaited directly in this
+    process (e.g. in tests) and the timeout is enforced locally.
+
     Args:
         task: Task definition
         task_config: Task configuration
         workflow_params: Workflow parameters
+        use_temporal: Schedule the activity via ``workflow.execute_activity``
 
     Returns:
         Task execution result
     """
     # Get activity function
-    if not activity_registry.has(task.activity_type):
+    activity_func = activity_registry.resolve(task.activity_type)
+    if activity_func is None:
         raise ValueError(f"Activity type '{task.activity_type}' not registered")
 
-    activity_func = activity_registry.get(task.activity_type)
-
     # Prepare activity arguments
     # Merge task config with workflow params
     activity_args = {**task_config, **workflow_params}
 
-    # Execute activity with retry policy
-    retry_policy = dsl_retry_to_temporal(task.retry) if task.retry else None
+    # Timeout precomputed on the task when the DSL was loaded
+    timeout = task.timeout_td
 
-    # Set timeout if specified
-    timeout = None
-    if task.timeout:
-        timeout = parse_duration(task.timeout)
+    if use_temporal:
+        # Pass activity_args as a single dict argument (Temporal doesn't accept arbitrary kwargs)
+        return await workflow.execute_activity(
+            activity_func,
+            activity_args,
+            start_to_close_timeout=timeout or DEFAULT_ACTIVITY_TIMEOUT,
+            retry_policy=task.temporal_retry_policy,
+            activity_id=f"task_{task.id}",
+        )
 
     try:
         if timeout:
-            result = await asyncio.wait_for(
-                activity_func(**activity_args),
-                timeout=timeout.total_seconds(),
-            )
+            async with async_timeout(timeout.total_seconds()):
+                result = await activity_func(**activity_args)
         else:
             result = await activity_func(**activity_args)
         return result
     except asyncio.TimeoutError:
-        raise TimeoutError(f"Task '{task.id}' timed out after {task.timeout}")
+        raise
     except Exception as e:
-        raise ActivityError(f"Task '{task.id}' failed: {str(e)}") from e
+        raise TaskExecutionError(task.id) from e
@@ -2,14 +2,30 @@
 
 from typing import Dict, Any, Optional
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timezone
 
+from workflow_engine.core.scheduler import DependencyScheduler
+from workflow_engine.dsl.graph import analyze_workflow
 from workflow_engine.dsl.schema import WorkflowDefinition as DSLWorkflowDefinition
 
 
 class WorkflowDefinitionModel:
     """Core workflow definition model."""
 
+    __slots__ = (
+        "id",
+        "name",
+        "version",
+        "description",
+        "dsl_definition",
+        "created_at",
+        "updated_at",
+        "_task_by_id",
+        "_all_task_ids",
+        "_dependents",
+        "_indegree_base",
+    )
+
     def __init__(
         self,
         id: UUID,
@@ -26,32 +42,56 @@ class WorkflowDefinitionModel:
         self.version = version
         self.description = description
         self.dsl_definition = dsl_definition
-        self.created_at = created_at or datetime.utcnow()
-        self.updated_at = updated_at or datetime.utcnow()
+        # Read the clock at most once so defaulted timestamps are identical
+        now = datetime.now(timezone.utc) if created_at is None or updated_at is None else None
+        self.created_at = created_at or now
+        self.updated_at = updated_at or now
+        self._task_by_id = {task.id: task for task in dsl_definition.tasks}
+        graph = analyze_workflow(dsl_definition.tasks)
+        self._all_task_ids = graph.task_ids
+        self._dependents, self._indegree_base = graph.dependents, graph.in_degree
 
     def get_task_by_id(self, task_id: str) -> Optional[Any]:
         """Get task by ID."""
-        for task in self.dsl_definition.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self._task_by_id.get(task_id)
 
     def get_tasks_without_dependencies(self) -> list:
         """Get tasks that have no dependencies."""
-        all_task_ids = {task.id for task in self.dsl_definition.tasks}
+        all_task_ids = self._all_task_ids
         tasks_without_deps = []
         for task in self.dsl_definition.tasks:
-            if not task.depends_on or all(dep not in all_task_ids for dep in task.depends_on):
+            deps = task.depends_on
+            if not deps or all_task_ids.isdisjoint(deps):
                 tasks_without_deps.append(task)
         return tasks_without_deps
 
     def get_ready_tasks(self, completed_task_ids: set) -> list:
         """Get tasks that are ready to execute (all dependencies completed)."""
+        # Only tasks without dependencies and dependents of completed tasks can be ready
+        candidates = {task_id for task_id, indegree in self._indegree_base.items() if indegree == 0}
+        dependents = self._dependents
+        for task_id in completed_task_ids:
+            candidates.update(dependents.get(task_id, ()))
+        candidates.difference_update(completed_task_ids)
+
+        if not isinstance(completed_task_ids, (set, frozenset)):
+            completed_task_ids = set(completed_task_ids)
+
         ready = []
         for task in self.dsl_definition.tasks:
-            if task.id in completed_task_ids:
+            if task.id not in candidates:
                 continue
-            if not task.depends_on or all(dep in completed_task_ids for dep in task.depends_on):
+            # Set methods loop in C, unlike all() over a generator
+            deps = task.depends_on
+            if not deps or completed_task_ids.issuperset(deps):
                 ready.append(task)
         return ready
 
+    def create_scheduler(self) -> DependencyScheduler:
+        """Create a scheduler that yields tasks as their dependencies complete.
+
+        Prefer this over calling ``get_ready_tasks`` after every completion,
+        which rescans all tasks each time.
+        """
+        return DependencyScheduler(self.dsl_definition.tasks, (self._dependents, self._indegree_base))
+
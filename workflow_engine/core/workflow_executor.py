@@ -7,6 +7,8 @@ from uuid import UUID
 from temporalio.client import Client, WorkflowHandle
 from temporalio.service import RPCError
 
+from workflow_engine.core.payload_converter import ORJSON_DATA_CONVERTER
+
 
 class WorkflowExecutor(ABC):
     """Abstract interface for workflow execution."""
@@ -174,5 +176,6 @@ async def create_temporal_client(
     return await Client.connect(
         f"{temporal_host}:{temporal_port}",
         namespace=namespace,
+        data_converter=ORJSON_DATA_CONVERTER,
     )
 
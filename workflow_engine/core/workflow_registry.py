@@ -1,17 +1,19 @@
 """Workflow auto-registration from workflows directory."""
 
+import asyncio
+import copy
 import logging
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 from workflow_engine.dsl.parser import WorkflowParser
+from workflow_engine.dsl.schema import WorkflowDefinition as DSLWorkflowDefinition
 from workflow_engine.dsl.validator import WorkflowValidator
-from workflow_engine.storage.database import get_async_session
+from workflow_engine.storage.database import get_async_session, get_read_session
 from workflow_engine.storage.repositories import (
     SQLAlchemyWorkflowRepository,
     SQLAlchemyExecutionRepository,
 )
-from workflow_engine.core.workflow_executor import TemporalWorkflowExecutor, create_temporal_client
 from workflow_engine.api.services import WorkflowService
 
 log = logging.getLogger(__name__)
@@ -19,6 +21,18 @@ log = logging.getLogger(__name__)
 # Get the workflows directory (project root / workflows)
 _WORKFLOWS_DIR = Path(__file__).parent.parent.parent / "workflows"
 
+# Per-file (name, mtime_ns, size) of the workflows directory, sorted by name
+_Fingerprint = Tuple[Path, Tuple[Tuple[str, int, int], ...]]
+
+# Last registration run without failures: (fingerprint, results, YAML stored per workflow name)
+_registration_cache: Optional[Tuple[_Fingerprint, dict, Dict[str, str]]] = None
+
+# Last directory listing as (directory mtime_ns, files); adding or removing a file bumps the mtime
+_discovery_cache: Optional[Tuple[int, Tuple[Path, ...]]] = None
+
+# Parsed workflow files: path -> ((mtime_ns, size), yaml_content, workflow_def, validation errors)
+_file_cache: Dict[Path, Tuple[Tuple[int, int], str, DSLWorkflowDefinition, Tuple[str, ...]]] = {}
+
 
 def discover_workflow_files() -> List[Path]:
     """Discover all YAML workflow files in the workflows directory.
@@ -26,35 +40,68 @@ def discover_workflow_files() -> List[Path]:
     Returns:
         List of Path objects for workflow YAML files
     """
-    if not _WORKFLOWS_DIR.exists():
+    global _discovery_cache
+    
+    try:
+        dir_mtime_ns = _WORKFLOWS_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
         log.warning(f"Workflows directory not found: {_WORKFLOWS_DIR}")
         return []
     
+    if _discovery_cache is not None and _discovery_cache[0] == dir_mtime_ns:
+        return list(_discovery_cache[1])
+    
     workflow_files = list(_WORKFLOWS_DIR.glob("*.yaml"))
+    _discovery_cache = (dir_mtime_ns, tuple(workflow_files))
     log.info(f"Discovered {len(workflow_files)} workflow file(s) in {_WORKFLOWS_DIR}")
     return workflow_files
 
 
+def _load_workflow_file(yaml_file: Path) -> Tuple[str, DSLWorkflowDefinition, Tuple[str, ...]]:
+    """Read, parse and validate a workflow file, reusing the result while its mtime and size are unchanged.
+
+    Args:
+        yaml_file: Path to workflow YAML file
+
+    Returns:
+        Tuple of (yaml_content, workflow_def, validation errors)
+    """
+    stat = yaml_file.stat()
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _file_cache.get(yaml_file)
+    if cached is not None and cached[0] == version:
+        return cached[1:]
+
+    yaml_content = yaml_file.read_text()
+    workflow_def = WorkflowParser.parse_yaml(yaml_content)
+    errors = tuple(WorkflowValidator.validate(workflow_def))
+    _file_cache[yaml_file] = (version, yaml_content, workflow_def, errors)
+    return yaml_content, workflow_def, errors
+
+
 async def register_workflow_from_file(
     yaml_file: Path,
     workflow_service: WorkflowService,
+    loaded: Optional[Union[Tuple[str, DSLWorkflowDefinition, Tuple[str, ...]], BaseException]] = None,
 ) -> Tuple[bool, str]:
     """Register or update a workflow from a YAML file.
     
     Args:
         yaml_file: Path to workflow YAML file
         workflow_service: WorkflowService instance for registration
+        loaded: Result of ``_load_workflow_file`` (or the exception it raised)
+            if the file was already loaded; loaded in a worker thread otherwise
     
     Returns:
         Tuple of (success: bool, message: str)
     """
     try:
-        # Read YAML content
-        yaml_content = yaml_file.read_text()
-        
-        # Parse and validate workflow
-        workflow_def = WorkflowParser.parse_yaml(yaml_content)
-        errors = WorkflowValidator.validate(workflow_def)
+        # Read, parse and validate workflow (cached per file mtime)
+        if loaded is None:
+            loaded = await asyncio.to_thread(_load_workflow_file, yaml_file)
+        elif isinstance(loaded, BaseException):
+            raise loaded
+        yaml_content, workflow_def, errors = loaded
         
         if errors:
             error_msg = f"Validation errors: {', '.join(errors)}"
@@ -63,6 +110,10 @@ async def register_workflow_from_file(
         
         # Check if workflow already exists
         existing = await workflow_service.workflow_repo.get_by_name(workflow_def.name)
+        if existing and existing.definition_yaml == yaml_content:
+            # Stored definition is byte-identical, nothing to update
+            log.debug(f"Workflow '{workflow_def.name}' from {yaml_file.name} is unchanged")
+            return True, f"Workflow '{workflow_def.name}' unchanged"
         if existing:
             # Update existing workflow
             try:
@@ -105,13 +156,94 @@ async def register_workflow_from_file(
         return False, error_msg
 
 
-async def register_all_workflows() -> dict:
+# Detail messages for each WorkflowService.register_workflows outcome
+_OUTCOME_MESSAGES = {
+    "registered": "Registered workflow '{name}'",
+    "updated": "Updated workflow '{name}'",
+    "unchanged": "Workflow '{name}' unchanged",
+}
+
+
+def _load_error(
+    yaml_file: Path,
+    loaded: Union[Tuple[str, DSLWorkflowDefinition, Tuple[str, ...]], BaseException],
+) -> Optional[str]:
+    """Describe why a workflow file could not be loaded, if it failed.
+    
+    Args:
+        yaml_file: Path to workflow YAML file
+        loaded: Result of ``_load_workflow_file`` or the exception it raised
+    
+    Returns:
+        Error message, or None if the file loaded and validated
+    """
+    if isinstance(loaded, FileNotFoundError):
+        error_msg = f"Workflow file not found: {yaml_file}"
+        log.error(error_msg)
+        return error_msg
+    if isinstance(loaded, BaseException):
+        error_msg = f"Unexpected error processing {yaml_file.name}: {loaded}"
+        log.error(error_msg, exc_info=loaded)
+        return error_msg
+    errors = loaded[2]
+    if errors:
+        error_msg = f"Validation errors: {', '.join(errors)}"
+        log.error(f"Failed to validate workflow {yaml_file.name}: {error_msg}")
+        return error_msg
+    return None
+
+
+def _workflows_fingerprint(workflow_files: List[Path]) -> _Fingerprint:
+    """Build a cache key from the name, mtime and size of every workflow file.
+
+    Comparing each file, rather than only the newest mtime, also catches edits
+    that keep or restore an older mtime (``git checkout``, ``cp -p``, rsync).
+
+    Args:
+        workflow_files: Discovered workflow YAML files
+
+    Returns:
+        Tuple of (workflows directory, per-file (name, mtime_ns, size))
+    """
+    entries = []
+    for workflow_file in workflow_files:
+        stat = workflow_file.stat()
+        entries.append((workflow_file.name, stat.st_mtime_ns, stat.st_size))
+    return _WORKFLOWS_DIR, tuple(sorted(entries))
+
+
+async def _registrations_current(stored_yaml: Dict[str, str]) -> bool:
+    """Check that the database still holds the workflows a cached run registered.
+
+    Catches a database that was reset, recreated or edited since that run.
+
+    Args:
+        stored_yaml: Registered YAML per workflow name
+
+    Returns:
+        True if every workflow exists with exactly that YAML
+    """
+    async with get_read_session() as session:
+        workflows = await SQLAlchemyWorkflowRepository(session).get_by_names(stored_yaml)
+    return {workflow.name: workflow.definition_yaml for workflow in workflows} == stored_yaml
+
+
+async def register_all_workflows(force: bool = False) -> dict:
     """Register all workflows from the workflows directory.
     
     This function:
     1. Discovers all YAML files in the workflows directory
     2. Parses and validates each workflow
-    3. Registers new workflows or updates existing ones
+    3. Registers new workflows or updates existing ones whose YAML changed,
+       in one batched database write
+    
+    A run that registered every file without failures is cached for the
+    lifetime of the process; later calls return a copy of it as long as no
+    workflow file has changed on disk and the database still holds the
+    registered definitions.
+    
+    Args:
+        force: Re-register even if the cached result is still fresh
     
     Returns:
         Dictionary with registration results:
@@ -119,6 +251,7 @@ async def register_all_workflows() -> dict:
             "total": int,
             "registered": int,
             "updated": int,
+            "unchanged": int,
             "failed": int,
             "details": List[dict]
         }
@@ -131,64 +264,91 @@ async def register_all_workflows() -> dict:
             "total": 0,
             "registered": 0,
             "updated": 0,
+            "unchanged": 0,
             "failed": 0,
             "details": [],
         }
     
+    global _registration_cache
+    try:
+        cache_key = _workflows_fingerprint(workflow_files)
+    except OSError:
+        cache_key = None
+    cached = _registration_cache
+    if not force and cache_key is not None and cached is not None and cached[0] == cache_key:
+        if await _registrations_current(cached[2]):
+            log.info("Workflow files and stored definitions unchanged since last registration, skipping")
+            return copy.deepcopy(cached[1])
+    
+    # Read and parse all files concurrently on the default thread pool; only
+    # the database writes below run one at a time on the shared session
+    loaded_files = await asyncio.gather(
+        *(asyncio.to_thread(_load_workflow_file, yaml_file) for yaml_file in workflow_files),
+        return_exceptions=True,
+    )
+    
     # Create workflow service within a single session
-    async for session in get_async_session():
+    async with get_async_session() as session:
         workflow_repo = SQLAlchemyWorkflowRepository(session)
         execution_repo = SQLAlchemyExecutionRepository(session)
         
-        # Create Temporal client for workflow service
-        temporal_client = await create_temporal_client()
-        workflow_executor = TemporalWorkflowExecutor(temporal_client)
-        
-        workflow_service = WorkflowService(workflow_repo, execution_repo, workflow_executor)
+        # Registration only writes definitions, so no Temporal executor is needed
+        workflow_service = WorkflowService(workflow_repo, execution_repo)
         
         results = {
             "total": len(workflow_files),
             "registered": 0,
             "updated": 0,
+            "unchanged": 0,
             "failed": 0,
             "details": [],
         }
         
-        # Register each workflow
-        for yaml_file in workflow_files:
-            success, message = await register_workflow_from_file(yaml_file, workflow_service)
-            detail = {
-                "file": yaml_file.name,
-                "success": success,
-                "message": message,
-            }
+        # Report files that failed to load or validate; collect the rest for one batched write
+        valid: List[Tuple[dict, str, DSLWorkflowDefinition]] = []
+        for yaml_file, loaded in zip(workflow_files, loaded_files):
+            detail = {"file": yaml_file.name, "success": False, "message": ""}
             results["details"].append(detail)
-            
-            if success:
-                # Check if it was an update or new registration
-                # We can infer this from the message
-                if "Updated" in message:
-                    results["updated"] += 1
-                else:
-                    results["registered"] += 1
-            else:
+            error_msg = _load_error(yaml_file, loaded)
+            if error_msg:
+                detail["message"] = error_msg
                 results["failed"] += 1
+            else:
+                yaml_content, workflow_def, _ = loaded
+                valid.append((detail, yaml_content, workflow_def))
         
-        # Explicitly commit the session to ensure all changes are persisted
-        # This is necessary because using 'break' with async for may exit before
-        # the context manager's commit runs
-        try:
-            await session.commit()
-        except Exception as e:
-            await session.rollback()
-            raise
-        # Session will auto-commit on successful completion (via get_async_session context manager)
-        break
+        # Register or update all valid workflows with one lookup and one flush
+        outcomes: List[str] = []
+        if valid:
+            try:
+                outcomes = await workflow_service.register_workflows(
+                    [(yaml_content, workflow_def) for _, yaml_content, workflow_def in valid]
+                )
+            except Exception as e:
+                log.error(f"Failed to register workflows: {e}", exc_info=True)
+                await session.rollback()
+                for detail, _, _ in valid:
+                    detail["message"] = f"Failed to register workflows: {e}"
+                results["failed"] += len(valid)
+        
+        for (detail, _, workflow_def), outcome in zip(valid, outcomes):
+            detail["success"] = True
+            detail["message"] = _OUTCOME_MESSAGES[outcome].format(name=workflow_def.name)
+            results[outcome] += 1
+            if outcome != "unchanged":
+                log.info(f"{outcome.capitalize()} workflow '{workflow_def.name}' v{workflow_def.version} from {detail['file']}")
+        # Session commits when the block exits (via the get_async_session context manager)
     
     log.info(
         f"Workflow registration complete: {results['registered']} registered, "
-        f"{results['updated']} updated, {results['failed']} failed out of {results['total']} total"
+        f"{results['updated']} updated, {results['unchanged']} unchanged, {results['failed']} failed out of {results['total']} total"
     )
     
+    if cache_key is not None and results["failed"] == 0:
+        stored_yaml = {workflow_def.name: yaml_content for _, yaml_content, workflow_def in valid}
+        _registration_cache = (cache_key, copy.deepcopy(results), stored_yaml)
+    else:
+        _registration_cache = None
+    
     return results
 
@@ -1,18 +1,33 @@
 """Temporal workflow implementations."""
 
 import asyncio
+import contextlib
 import logging
+import re
+from collections import deque
 from typing import Dict, Any, List, Optional
 from datetime import timedelta
 
 from temporalio import workflow
-from temporalio.common import RetryPolicy
 
+from workflow_engine.dsl.graph import analyze_workflow
 from workflow_engine.dsl.schema import WorkflowDefinition as DSLWorkflowDefinition, Task
-from workflow_engine.core.task_executor import parse_duration, activity_registry
+from workflow_engine.core.scheduler import DependencyScheduler
+from workflow_engine.core.task_executor import DEFAULT_ACTIVITY_TIMEOUT, activity_registry
 
 logger = logging.getLogger(__name__)
 
+# {{ parameter_name }} placeholders in task config strings
+_TEMPLATE_RE = re.compile(r'\{\{\s*([^}]+)\s*\}\}')
+
+# Patch ID guarding dependency-driven task starts (see _run_as_ready), so
+# workflows started under wave scheduling still replay deterministically
+_DEPENDENCY_SCHEDULER_PATCH = "dependency-scheduler"
+
+# Patch ID guarding concurrent compensation (see _run_compensations), so
+# workflows that began compensating one task at a time replay the same way
+_CONCURRENT_COMPENSATION_PATCH = "concurrent-compensation"
+
 
 @workflow.defn
 class WorkflowEngineWorkflow:
@@ -24,6 +39,8 @@ class WorkflowEngineWorkflow:
         self.failed_tasks: Dict[str, str] = {}
         self.completed_tasks_order: List[str] = []  # Track completion order for compensation
         self.task_definitions: Dict[str, Task] = {}  # Store task definitions for compensation
+        self._compensation_plan: List[Task] = []  # Completed tasks that define a compensation
+        self._execution_id: Optional[str] = None  # Execution ID parsed from the Temporal workflow ID
 
     @workflow.run
     async def run(self, workflow_data: tuple) -> Dict[str, Any]:
@@ -46,17 +63,15 @@ class WorkflowEngineWorkflow:
             workflow_def = workflow_def_raw
         
         # Store task definitions for compensation access
-        for task in workflow_def.tasks:
-            self.task_definitions[task.id] = task
+        self.task_definitions = {task.id: task for task in workflow_def.tasks}
         
-        completed_task_ids: set = set()
-        all_task_ids = {task.id for task in workflow_def.tasks}
-
-        # Extract execution ID from Temporal workflow ID for status updates
-        workflow_info = workflow.info()
-        execution_id_str = None
-        if workflow_info.workflow_id and workflow_info.workflow_id.startswith("workflow-"):
-            execution_id_str = workflow_info.workflow_id.replace("workflow-", "")
+        scheduler = DependencyScheduler(workflow_def.tasks)
+
+        # Extract execution ID from Temporal workflow ID (format: "workflow-{execution.id.hex}";
+        # UUID() accepts both the hex and the hyphenated form) once for status updates and activities
+        workflow_id = workflow.info().workflow_id
+        if workflow_id and workflow_id.startswith("workflow-"):
+            self._execution_id = workflow_id.removeprefix("workflow-")
         
         # Execute tasks in dependency order with compensation support
         workflow_result = None
@@ -64,42 +79,12 @@ class WorkflowEngineWorkflow:
         workflow_status = "COMPLETED"
         
         try:
-            while len(completed_task_ids) < len(all_task_ids):
-                # Get ready tasks (all dependencies completed)
-                ready_tasks = self._get_ready_tasks(workflow_def.tasks, completed_task_ids)
-
-                if not ready_tasks:
-                    # Check if we have failed tasks that prevent progress
-                    remaining = all_task_ids - completed_task_ids
-                    if remaining:
-                        failed_remaining = [tid for tid in remaining if tid in self.failed_tasks]
-                        if failed_remaining:
-                            raise Exception(f"Workflow failed: tasks {failed_remaining} failed and cannot proceed")
-                    break
-
-                # Execute ready tasks (can be parallel)
-                if len(ready_tasks) == 1:
-                    # Sequential execution
-                    task = ready_tasks[0]
-                    result = await self._execute_task_with_retry(task, workflow_def, parameters)
-                    self.task_results[task.id] = result
-                    completed_task_ids.add(task.id)
-                    self.completed_tasks_order.append(task.id)
-                else:
-                    # Parallel execution
-                    tasks_to_run = ready_tasks
-                    results = await asyncio.gather(
-                        *[self._execute_task_with_retry(task, workflow_def, parameters) for task in tasks_to_run],
-                        return_exceptions=True,
-                    )
-
-                    for task, result in zip(tasks_to_run, results):
-                        if isinstance(result, Exception):
-                            self.failed_tasks[task.id] = str(result)
-                            raise Exception(f"Task '{task.id}' failed: {result}") from result
-                        self.task_results[task.id] = result
-                        completed_task_ids.add(task.id)
-                        self.completed_tasks_order.append(task.id)
+            if workflow.patched(_DEPENDENCY_SCHEDULER_PATCH):
+                await self._run_as_ready(scheduler, workflow_def, parameters)
+            else:
+                # Histories recorded before the patch ran tasks in waves;
+                # replay them with the same commands
+                await self._run_in_waves(scheduler, workflow_def, parameters)
 
             # Workflow completed successfully
             workflow_result = {
@@ -117,10 +102,10 @@ class WorkflowEngineWorkflow:
             raise
         finally:
             # Update database status regardless of success or failure
-            if execution_id_str:
+            if self._execution_id:
                 try:
                     await self._update_execution_status(
-                        execution_id_str,
+                        self._execution_id,
                         workflow_status,
                         workflow_result,
                         workflow_error,
@@ -129,6 +114,105 @@ class WorkflowEngineWorkflow:
                     # Log but don't fail workflow if status update fails
                     logger.error(f"Failed to update execution status: {e}")
 
+    async def _run_as_ready(
+        self,
+        scheduler: DependencyScheduler,
+        workflow_def: DSLWorkflowDefinition,
+        parameters: Dict[str, Any],
+    ) -> None:
+        """Start each task as soon as its dependencies complete.
+
+        One slow task only delays its own dependents instead of a whole wave.
+
+        Raises:
+            Exception: If a task failed, once the tasks already running finish
+        """
+        max_concurrency = workflow_def.max_concurrency
+        running: Dict[asyncio.Task, Task] = {}
+        first_failure = None
+
+        while True:
+            # Stop launching new tasks once any task has failed
+            while (
+                first_failure is None
+                and scheduler.has_ready()
+                and (max_concurrency is None or len(running) < max_concurrency)
+            ):
+                task = scheduler.pop_ready()
+                running[asyncio.create_task(self._execute_task_with_retry(task, workflow_def, parameters))] = task
+
+            if not running:
+                break
+
+            for future in await self._wait_for_any(running):
+                task = running.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    self.failed_tasks[task.id] = str(e)
+                    if first_failure is None:
+                        first_failure = (task, e)
+                    continue
+                self.task_results[task.id] = result
+                scheduler.mark_completed(task.id)
+                self._record_completion(task)
+
+        # In-flight siblings have finished, so their completions are
+        # recorded for compensation before the failure is raised
+        if first_failure is not None:
+            failed_task, error = first_failure
+            raise Exception(f"Task '{failed_task.id}' failed: {error}") from error
+
+    async def _run_in_waves(
+        self,
+        scheduler: DependencyScheduler,
+        workflow_def: DSLWorkflowDefinition,
+        parameters: Dict[str, Any],
+    ) -> None:
+        """Run all ready tasks together, then the tasks they unblocked, and so on.
+
+        The scheduling used before ``_DEPENDENCY_SCHEDULER_PATCH``; each wave
+        starts its tasks in definition order, as the original rescan did.
+
+        Raises:
+            Exception: If a task in a wave failed
+        """
+        task_order = {task.id: index for index, task in enumerate(workflow_def.tasks)}
+        wave = scheduler.drain_ready()
+        while wave:
+            results = await asyncio.gather(
+                *[self._execute_task_with_retry(task, workflow_def, parameters) for task in wave],
+                return_exceptions=True,
+            )
+            for task, result in zip(wave, results):
+                if isinstance(result, Exception):
+                    self.failed_tasks[task.id] = str(result)
+                    raise Exception(f"Task '{task.id}' failed: {result}") from result
+                self.task_results[task.id] = result
+                scheduler.mark_completed(task.id)
+                self._record_completion(task)
+            wave = sorted(scheduler.drain_ready(), key=lambda task: task_order[task.id])
+
+    @staticmethod
+    async def _wait_for_any(running: Dict[asyncio.Task, Task]) -> List[asyncio.Task]:
+        """Wait until at least one running task finishes.
+
+        Args:
+            running: In-flight asyncio tasks and the workflow task each runs
+
+        Returns:
+            Finished asyncio tasks in the order they were started, so results
+            are handled the same way on every replay
+        """
+        if len(running) == 1:
+            # Sequential stretches need no wait set; the outcome is read by the caller
+            only = next(iter(running))
+            with contextlib.suppress(Exception):
+                await only
+            return [only]
+        done, _ = await workflow.wait(list(running), return_when=asyncio.FIRST_COMPLETED)
+        return [future for future in running if future in done]
+
     async def _execute_task_with_retry(
         self,
         task: Task,
@@ -146,60 +230,35 @@ class WorkflowEngineWorkflow:
             Task result
         """
         # Prepare activity arguments
-        # Copy task.config and substitute template variables {{ parameter_name }} with workflow parameters
-        activity_args = self._substitute_templates(task.config.copy() if task.config else {}, parameters) if task.config else {}
+        # Substitute template variables {{ parameter_name }} with workflow parameters; this builds
+        # a new dict, so task.config itself is never copied or mutated
+        activity_args = self._substitute_templates(task.config, parameters) if task.config else {}
         
         # Add task_id for activities that need it (e.g., human_approval)
         activity_args["task_id"] = task.id
         
         # Add workflow_execution_id for activities that need it (e.g., human_approval)
-        # Extract execution ID from Temporal workflow ID (format: "workflow-{execution.id}")
-        workflow_info = workflow.info()
-        if workflow_info.workflow_id and workflow_info.workflow_id.startswith("workflow-"):
-            execution_id_str = workflow_info.workflow_id.replace("workflow-", "")
-            activity_args["workflow_execution_id"] = execution_id_str
-
-        # Set timeout
-        timeout = timedelta(hours=1)  # Default
-        if task.timeout:
-            timeout = parse_duration(task.timeout)
-
-        # Get retry policy
-        retry_policy = None
-        if task.retry:
-            dsl_retry = task.retry
-            retry_policy = RetryPolicy(
-                initial_interval=parse_duration(dsl_retry.initial_interval),
-                backoff_coefficient=dsl_retry.multiplier,
-                maximum_interval=parse_duration(dsl_retry.max_interval),
-                maximum_attempts=dsl_retry.max_attempts,
-            )
+        if self._execution_id is not None:
+            activity_args["workflow_execution_id"] = self._execution_id
+
+        # Timeout and retry policy are precomputed on the task when the DSL is loaded
+        timeout = task.timeout_td or DEFAULT_ACTIVITY_TIMEOUT
+        retry_policy = task.temporal_retry_policy
 
         # Use activity_id for better UI visibility
         activity_id = f"task_{task.id}"
 
         # Execute activity based on activity_type using registry
-        # Try to get activity function from registry, fallback to string name
-        if activity_registry.has(task.activity_type):
-            activity_func = activity_registry.get(task.activity_type)
-            # Pass activity_args as a single dict argument (Temporal doesn't accept arbitrary kwargs)
-            result = await workflow.execute_activity(
-                activity_func,
-                activity_args,  # Pass as single positional argument (dict)
-                start_to_close_timeout=timeout,
-                retry_policy=retry_policy,
-                activity_id=activity_id,
-            )
-        else:
-            # Fallback to string name - Temporal will resolve it
-            # Pass activity_args as a single dict argument (Temporal doesn't accept arbitrary kwargs)
-            result = await workflow.execute_activity(
-                task.activity_type,
-                activity_args,  # Pass as single positional argument (dict)
-                start_to_close_timeout=timeout,
-                retry_policy=retry_policy,
-                activity_id=activity_id,
-            )
+        # Try to get activity function from registry, fallback to string name - Temporal will resolve it
+        activity_func = activity_registry.resolve(task.activity_type) or task.activity_type
+        # Pass activity_args as a single dict argument (Temporal doesn't accept arbitrary kwargs)
+        result = await workflow.execute_activity(
+            activity_func,
+            activity_args,  # Pass as single positional argument (dict)
+            start_to_close_timeout=timeout,
+            retry_policy=retry_policy,
+            activity_id=activity_id,
+        )
 
         return result
 
@@ -224,61 +283,36 @@ class WorkflowEngineWorkflow:
         # Prepare compensation activity arguments
         # Compensation config can access task results via template syntax
         # For now, we pass task_results in the args so activities can access them
-        compensation_args = compensation.config.copy() if compensation.config else {}
-        compensation_args["task_id"] = task.id
-        compensation_args["original_task_id"] = task.id
-        compensation_args["task_results"] = self.task_results
-        compensation_args["workflow_parameters"] = parameters
+        compensation_args = {
+            **(compensation.config or {}),
+            "task_id": task.id,
+            "original_task_id": task.id,
+            "task_results": self.task_results,
+            "workflow_parameters": parameters,
+        }
 
         # Add workflow_execution_id for activities that need it
-        try:
-            workflow_info = workflow.info()
-            if workflow_info.workflow_id and workflow_info.workflow_id.startswith("workflow-"):
-                execution_id_str = workflow_info.workflow_id.replace("workflow-", "")
-                compensation_args["workflow_execution_id"] = execution_id_str
-        except Exception:
-            # Not in workflow context (e.g., during tests), skip
-            pass
-
-        # Set timeout
-        timeout = timedelta(hours=1)  # Default
-        if compensation.timeout:
-            timeout = parse_duration(compensation.timeout)
-
-        # Get retry policy for compensation
-        retry_policy = None
-        if compensation.retry:
-            dsl_retry = compensation.retry
-            retry_policy = RetryPolicy(
-                initial_interval=parse_duration(dsl_retry.initial_interval),
-                backoff_coefficient=dsl_retry.multiplier,
-                maximum_interval=parse_duration(dsl_retry.max_interval),
-                maximum_attempts=dsl_retry.max_attempts,
-            )
+        if self._execution_id is not None:
+            compensation_args["workflow_execution_id"] = self._execution_id
+
+        # Timeout and retry policy are precomputed on the compensation when the DSL is loaded
+        timeout = compensation.timeout_td or DEFAULT_ACTIVITY_TIMEOUT
+        retry_policy = compensation.temporal_retry_policy
 
         # Use activity_id for better UI visibility
         activity_id = f"compensate_{task.id}"
 
         # Execute compensation activity
         try:
-            if activity_registry.has(compensation.activity_type):
-                activity_func = activity_registry.get(compensation.activity_type)
-                await workflow.execute_activity(
-                    activity_func,
-                    compensation_args,
-                    start_to_close_timeout=timeout,
-                    retry_policy=retry_policy,
-                    activity_id=activity_id,
-                )
-            else:
-                # Fallback to string name
-                await workflow.execute_activity(
-                    compensation.activity_type,
-                    compensation_args,
-                    start_to_close_timeout=timeout,
-                    retry_policy=retry_policy,
-                    activity_id=activity_id,
-                )
+            # Fallback to string name if the activity is not registered
+            activity_func = activity_registry.resolve(compensation.activity_type) or compensation.activity_type
+            await workflow.execute_activity(
+                activity_func,
+                compensation_args,
+                start_to_close_timeout=timeout,
+                retry_policy=retry_policy,
+                activity_id=activity_id,
+            )
         except Exception as e:
             # Log compensation failure but continue with other compensations
             # This ensures we attempt all compensations even if one fails
@@ -286,35 +320,97 @@ class WorkflowEngineWorkflow:
             # Re-raise to surface the error, but we'll catch it in _run_compensations
             raise
 
+    def _record_completion(self, task: Task) -> None:
+        """Record a completed task for ordering and compensation.
+
+        Args:
+            task: Task that completed successfully
+        """
+        self.completed_tasks_order.append(task.id)
+        if task.compensation:
+            self._compensation_plan.append(task)
+
     async def _run_compensations(
         self,
         workflow_def: DSLWorkflowDefinition,
         parameters: Dict[str, Any],
     ) -> None:
-        """Execute compensations for all completed tasks in reverse order.
+        """Execute compensations for all completed tasks in reverse dependency order.
+
+        A task is compensated once every completed task depending on it has
+        been compensated (or has no compensation), so compensations of
+        independent branches run concurrently, up to ``max_concurrency``.
+        Executions recorded before ``_CONCURRENT_COMPENSATION_PATCH``
+        compensate serially in reverse completion order.
 
         Args:
             workflow_def: Workflow definition
             parameters: Workflow parameters
         """
-        if not self.completed_tasks_order:
-            return  # No completed tasks to compensate
+        if not self._compensation_plan:
+            return
 
-        # Execute compensations in reverse order of completion
-        for task_id in reversed(self.completed_tasks_order):
-            task = self.task_definitions.get(task_id)
-            if not task:
-                continue  # Task definition not found, skip
-
-            if task.compensation:
+        if not workflow.patched(_CONCURRENT_COMPENSATION_PATCH):
+            # Histories recorded before the patch compensated one task at a
+            # time in reverse completion order; replay them the same way
+            for task in reversed(self._compensation_plan):
                 try:
                     await self._execute_compensation(task, workflow_def, parameters)
                 except Exception as e:
                     # Log but continue with other compensations
                     logger.error(
-                        f"Failed to execute compensation for task '{task_id}': {e}. "
+                        f"Failed to execute compensation for task '{task.id}': {e}. "
+                        "Continuing with other compensations."
+                    )
+            return
+
+        # Walking completions backwards visits dependents before their
+        # dependencies. For each completed task, collect the nearest
+        # compensated tasks downstream of it; tasks without a compensation
+        # pass their own blockers through. Dicts keep the order deterministic.
+        plan_ids = {task.id: task for task in self._compensation_plan}
+        completed = dict.fromkeys(self.completed_tasks_order)
+        dependents = analyze_workflow(workflow_def.tasks).dependents
+        blockers: Dict[str, Dict[str, None]] = {}
+        for task_id in reversed(self.completed_tasks_order):
+            task_blockers: Dict[str, None] = {}
+            for dependent_id in dependents.get(task_id, ()):
+                if dependent_id not in completed:
+                    continue
+                if dependent_id in plan_ids:
+                    task_blockers[dependent_id] = None
+                else:
+                    task_blockers.update(blockers.get(dependent_id, {}))
+            blockers[task_id] = task_blockers
+
+        waiting = {task_id: len(blockers[task_id]) for task_id in plan_ids}
+        unblocks: Dict[str, List[Task]] = {}
+        for task_id in plan_ids:
+            for blocker_id in blockers[task_id]:
+                unblocks.setdefault(blocker_id, []).append(plan_ids[task_id])
+
+        ready = deque(task for task in reversed(self._compensation_plan) if waiting[task.id] == 0)
+        max_concurrency = workflow_def.max_concurrency
+        running: Dict[asyncio.Task, Task] = {}
+        while ready or running:
+            while ready and (max_concurrency is None or len(running) < max_concurrency):
+                task = ready.popleft()
+                running[asyncio.create_task(self._execute_compensation(task, workflow_def, parameters))] = task
+
+            for future in await self._wait_for_any(running):
+                task = running.pop(future)
+                try:
+                    future.result()
+                except Exception as e:
+                    # Log but continue with other compensations
+                    logger.error(
+                        f"Failed to execute compensation for task '{task.id}': {e}. "
                         "Continuing with other compensations."
                     )
+                for unblocked in unblocks.get(task.id, ()):
+                    waiting[unblocked.id] -= 1
+                    if waiting[unblocked.id] == 0:
+                        ready.append(unblocked)
 
     async def _update_execution_status(
         self,
@@ -331,10 +427,10 @@ class WorkflowEngineWorkflow:
             result: Optional workflow result
             error: Optional error message
         """
-        if not activity_registry.has("update_execution_status"):
+        update_activity = activity_registry.resolve("update_execution_status")
+        if update_activity is None:
             return  # Activity not registered, skip update
         
-        update_activity = activity_registry.get("update_execution_status")
         update_args = {
             "execution_id": execution_id,
             "status": status,
@@ -364,8 +460,6 @@ class WorkflowEngineWorkflow:
         Returns:
             Config with templates substituted
         """
-        import re
-        
         if isinstance(config, dict):
             result = {}
             for key, value in config.items():
@@ -374,36 +468,6 @@ class WorkflowEngineWorkflow:
         elif isinstance(config, list):
             return [WorkflowEngineWorkflow._substitute_templates(item, parameters) for item in config]
         elif isinstance(config, str):
-            # Replace {{ parameter_name }} with parameter value
-            def replace_template(match):
-                param_name = match.group(1).strip()
-                param_value = parameters.get(param_name, match.group(0))
-                # Preserve type for non-strings, convert to string for template replacement
-                if isinstance(param_value, (bool, int, float)):
-                    return str(param_value).lower() if isinstance(param_value, bool) else str(param_value)
-                return str(param_value)
-            
-            pattern = r'\{\{\s*([^}]+)\s*\}\}'
-            return re.sub(pattern, replace_template, config)
-        else:
-            return config
-
-    @staticmethod
-    def _get_ready_tasks(tasks: List[Task], completed_task_ids: set) -> List[Task]:
-        """Get tasks ready to execute (all dependencies completed).
-
-        Args:
-            tasks: All tasks in workflow
-            completed_task_ids: Set of completed task IDs
-
-        Returns:
-            List of ready tasks
-        """
-        ready = []
-        for task in tasks:
-            if task.id in completed_task_ids:
-                continue
-            if not task.depends_on or all(dep in completed_task_ids for dep in task.depends_on):
-                ready.append(task)
-        return ready
-
+            # Most config strings contain no template; skip the regex for them
+            if '{{' not in config:
+                return config
@@ -0,0 +1,42 @@
+"""Duration strings used by the workflow DSL (e.g. "5s", "10m", "1h")."""
+
+from datetime import timedelta
+from functools import lru_cache
+
+# Seconds per duration unit suffix
+_UNIT_SECONDS = {"s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+@lru_cache(maxsize=256)
+def parse_duration_seconds(duration_str: str) -> float:
+    """Parse duration string to a number of seconds.
+
+    Args:
+        duration_str: Duration string (e.g., "5s", "10m", "1h")
+
+    Returns:
+        Duration in seconds
+    """
+    if not duration_str:
+        raise ValueError("Duration string cannot be empty")
+
+    unit = duration_str[-1]
+    multiplier = _UNIT_SECONDS.get(unit)
+    if multiplier is None:
+        raise ValueError(f"Invalid duration unit: {unit}. Use s, m, or h")
+    return float(duration_str[:-1]) * multiplier
+
+
+@lru_cache(maxsize=256)
+def parse_duration(duration_str: str) -> timedelta:
+    """Parse duration string to timedelta.
+
+    Results are memoized; workflows tend to reuse a handful of values like "30s".
+
+    Args:
+        duration_str: Duration string (e.g., "5s", "10m", "1h")
+
+    Returns:
+        timedelta object
+    """
+    return timedelta(seconds=parse_duration_seconds(duration_str))
@@ -0,0 +1,91 @@
+"""Dependency graph analysis for workflow tasks."""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+
+@dataclass(frozen=True)
+class WorkflowGraph:
+    """Dependency structure of a workflow's tasks and any problems found in it.
+
+    Attributes:
+        task_ids: IDs of all tasks
+        has_duplicate_ids: Whether two tasks share an ID
+        in_degree: Number of distinct dependencies of each task
+        dependents: IDs of the tasks depending on each task
+        unknown_dependencies: Dependencies naming no task, per task ID
+        self_dependent_ids: IDs of tasks that depend on themselves
+        cycle_task_id: First task (in definition order) on or behind a cycle, if any
+    """
+
+    task_ids: FrozenSet[str]
+    has_duplicate_ids: bool
+    in_degree: Dict[str, int]
+    dependents: Dict[str, List[str]]
+    unknown_dependencies: Dict[str, List[str]]
+    self_dependent_ids: FrozenSet[str]
+    cycle_task_id: Optional[str]
+
+    @property
+    def has_dependency_errors(self) -> bool:
+        """Whether any task has an unknown or self dependency."""
+        return bool(self.unknown_dependencies or self.self_dependent_ids)
+
+
+def analyze_workflow(tasks: Iterable) -> WorkflowGraph:
+    """Check task dependencies and build the graph used for scheduling.
+
+    Collects duplicate IDs, unknown and self dependencies, and cycles (with
+    Kahn's algorithm) in O(tasks + dependencies) without raising, so both the
+    schema and ``WorkflowValidator`` can report from the same pass.
+
+    Args:
+        tasks: Workflow tasks
+
+    Returns:
+        Analyzed workflow graph
+    """
+    tasks = list(tasks)
+    task_ids = frozenset(task.id for task in tasks)
+    in_degree: Dict[str, int] = {}
+    dependents: Dict[str, List[str]] = {task.id: [] for task in tasks}
+    unknown_dependencies: Dict[str, List[str]] = {}
+    self_dependent_ids = set()
+
+    for task in tasks:
+        # dict.fromkeys drops repeated dependencies while keeping their order
+        deps = dict.fromkeys(task.depends_on) if task.depends_on else ()
+        in_degree[task.id] = len(deps)
+        for dep_id in deps:
+            if dep_id not in task_ids:
+                unknown_dependencies.setdefault(task.id, []).append(dep_id)
+                continue
+            if dep_id == task.id:
+                self_dependent_ids.add(task.id)
+            dependents[dep_id].append(task.id)
+
+    # Repeatedly remove tasks whose dependencies are all removed; whatever is
+    # left is on, or depends on, a cycle (or an unknown task)
+    remaining = dict(in_degree)
+    queue = deque(task_id for task_id, degree in remaining.items() if degree == 0)
+    while queue:
+        for dependent_id in dependents[queue.popleft()]:
+            remaining[dependent_id] -= 1
+            if remaining[dependent_id] == 0:
+                queue.append(dependent_id)
+
+    # Only report a cycle when it is not explained by a self or unknown dependency
+    cycle_task_id = None
+    if not unknown_dependencies and not self_dependent_ids:
+        cycle_task_id = next((task.id for task in tasks if remaining[task.id] > 0), None)
+
+    return WorkflowGraph(
+        task_ids=task_ids,
+        has_duplicate_ids=len(task_ids) != len(tasks),
+        in_degree=in_degree,
+        dependents=dependents,
+        unknown_dependencies=unknown_dependencies,
+        self_dependent_ids=frozenset(self_dependent_ids),
+        cycle_task_id=cycle_task_id,
+    )
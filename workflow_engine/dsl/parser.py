@@ -1,11 +1,23 @@
 """YAML workflow parser."""
 
 import yaml
+from functools import lru_cache
 from typing import Dict, Any
 from pathlib import Path
 
 from workflow_engine.dsl.schema import WorkflowDefinition
 
+# Prefer the libyaml-backed loader/dumper; fall back to pure Python if PyYAML was built without it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+@lru_cache(maxsize=256)
+def _parse_file_cached(path: str, mtime_ns: int, size: int) -> WorkflowDefinition:
+    """Parse a workflow file; the stat fields only key the cache so edits are re-read."""
+    with open(path, "r") as f:
+        return WorkflowParser.parse_yaml(f.read())
+
 
 class WorkflowParser:
     """Parser for YAML workflow definitions."""
@@ -24,7 +36,7 @@ class WorkflowParser:
             ValueError: If YAML is invalid or doesn't match schema
         """
         try:
-            data = yaml.safe_load(yaml_content)
+            data = yaml.load(yaml_content, Loader=_YamlLoader)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML: {e}") from e
 
@@ -40,6 +52,9 @@ class WorkflowParser:
     def parse_file(file_path: str | Path) -> WorkflowDefinition:
         """Parse YAML file into WorkflowDefinition.
 
+        Parsed definitions are cached until the file's modification time or size
+        changes; each call returns its own copy.
+
         Args:
             file_path: Path to YAML file
 
@@ -50,14 +65,14 @@ class WorkflowParser:
             FileNotFoundError: If file doesn't exist
             ValueError: If YAML is invalid or doesn't match schema
         """
-        path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Workflow file not found: {file_path}")
-
-        with open(path, "r") as f:
-            yaml_content = f.read()
+        path = Path(file_path).resolve()
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Workflow file not found: {file_path}") from None
 
-        return WorkflowParser.parse_yaml(yaml_content)
+        # Deep copy so callers cannot alter the cached definition
+        return _parse_file_cached(str(path), st.st_mtime_ns, st.st_size).model_copy(deep=True)
 
     @staticmethod
     def to_dict(workflow: WorkflowDefinition) -> Dict[str, Any]:
@@ -82,5 +97,7 @@ class WorkflowParser:
             YAML string representation
         """
         # Use mode='json' to serialize enums as their values, not Python objects
-        return yaml.dump(workflow.model_dump(mode='json'), default_flow_style=False, sort_keys=False)
+        return yaml.dump(
+            workflow.model_dump(mode='json'), Dumper=_YamlDumper, default_flow_style=False, sort_keys=False
+        )
 
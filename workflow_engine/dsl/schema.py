@@ -1,9 +1,32 @@
 """Workflow DSL schema definitions."""
 
+import re
+from datetime import timedelta
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 from enum import Enum
 
+from temporalio.common import RetryPolicy as TemporalRetryPolicy
+
+from workflow_engine.dsl.durations import parse_duration
+from workflow_engine.dsl.graph import analyze_workflow
+
+
+# Duration strings: a non-negative number followed by a unit ("30s", "1.5m", "2h")
+_DURATION_RE = re.compile(r"(?:\d+(?:\.\d*)?|\.\d+)[smh]")
+_DURATION_UNITS = frozenset("smh")
+
+
+def _check_duration(v: str, label: str) -> str:
+    """Validate a duration string, raising ValueError with a message naming ``label``."""
+    if _DURATION_RE.fullmatch(v):
+        return v
+    if not v:
+        raise ValueError(f"{label} cannot be empty")
+    if v[-1] not in _DURATION_UNITS:
+        raise ValueError(f"{label} must end with s (seconds), m (minutes), or h (hours)")
+    raise ValueError(f"Invalid {label.lower()} format: {v}")
+
 
 class ParameterType(str, Enum):
     """Parameter types."""
@@ -37,20 +60,38 @@ class RetryPolicy(BaseModel):
     @field_validator("initial_interval", "max_interval")
     @classmethod
     def validate_interval(cls, v: str) -> str:
-        """Validate interval format."""
-        if not v:
-            raise ValueError("Interval cannot be empty")
-        # Basic validation - should be number + unit (s, m, h)
-        if not v[-1] in ["s", "m", "h"]:
-            raise ValueError("Interval must end with s (seconds), m (minutes), or h (hours)")
-        try:
-            float(v[:-1])
-        except ValueError:
-            raise ValueError(f"Invalid interval format: {v}")
-        return v
+        """Validate interval format (number + unit s, m or h)."""
+        return _check_duration(v, "Interval")
+
+    def to_temporal(self) -> TemporalRetryPolicy:
+        """Build the equivalent Temporal retry policy."""
+        return TemporalRetryPolicy(
+            initial_interval=parse_duration(self.initial_interval),
+            backoff_coefficient=self.multiplier,
+            maximum_interval=parse_duration(self.max_interval),
+            maximum_attempts=self.max_attempts,
+        )
+
 
+class _ExecutionSettings(BaseModel):
+    """Mixin exposing the parsed timeout and Temporal retry policy of an activity.
 
-class Compensation(BaseModel):
+    Both are derived from the current ``timeout`` and ``retry`` on each access,
+    so reassigning either field is reflected; duration parsing is memoized.
+    """
+
+    @property
+    def timeout_td(self) -> Optional[timedelta]:
+        """Parsed ``timeout``, or None if not set."""
+        return parse_duration(self.timeout) if self.timeout else None
+
+    @property
+    def temporal_retry_policy(self) -> Optional[TemporalRetryPolicy]:
+        """Temporal retry policy built from ``retry``, or None if not set."""
+        return self.retry.to_temporal() if self.retry else None
+
+
+class Compensation(_ExecutionSettings):
     """Compensation activity definition for task rollback."""
 
     activity_type: str  # e.g., "http_request", "python_function"
@@ -64,16 +105,10 @@ class Compensation(BaseModel):
         """Validate timeout format."""
         if v is None:
             return v
-        if not v[-1] in ["s", "m", "h"]:
-            raise ValueError("Timeout must end with s (seconds), m (minutes), or h (hours)")
-        try:
-            float(v[:-1])
-        except ValueError:
-            raise ValueError(f"Invalid timeout format: {v}")
-        return v
+        return _check_duration(v, "Timeout")
 
 
-class Task(BaseModel):
+class Task(_ExecutionSettings):
     """Workflow task definition."""
 
     id: str
@@ -92,13 +127,7 @@ class Task(BaseModel):
         """Validate timeout format."""
         if v is None:
             return v
-        if not v[-1] in ["s", "m", "h"]:
-            raise ValueError("Timeout must end with s (seconds), m (minutes), or h (hours)")
-        try:
-            float(v[:-1])
-        except ValueError:
-            raise ValueError(f"Invalid timeout format: {v}")
-        return v
+        return _check_duration(v, "Timeout")
 
 
 class WorkflowDefinition(BaseModel):
@@ -109,6 +138,7 @@ class WorkflowDefinition(BaseModel):
     description: Optional[str] = None
     parameters: List[Parameter] = Field(default_factory=list)
     tasks: List[Task] = Field(min_length=1)
+    max_concurrency: Optional[int] = Field(default=None, ge=1)  # Max tasks running at once; unlimited if unset
 
     @field_validator("version", mode="before")
     @classmethod
@@ -118,52 +148,26 @@ class WorkflowDefinition(BaseModel):
             return str(v)
         return str(v) if v else "1.0"
 
-    @field_validator("tasks")
-    @classmethod
-    def validate_tasks(cls, tasks: List[Task]) -> List[Task]:
-        """Validate task dependencies."""
-        task_ids = {task.id for task in tasks}
-        
+    @model_validator(mode="after")
+    def validate_tasks(self):
+        """Validate task IDs and dependencies."""
+        graph = analyze_workflow(self.tasks)
+
         # Check for duplicate task IDs
-        if len(task_ids) != len(tasks):
+        if graph.has_duplicate_ids:
             raise ValueError("Duplicate task IDs found")
 
         # Validate dependencies
-        for task in tasks:
-            if task.depends_on:
-                for dep_id in task.depends_on:
-                    if dep_id not in task_ids:
-                        raise ValueError(f"Task '{task.id}' depends on unknown task '{dep_id}'")
-                    if dep_id == task.id:
-                        raise ValueError(f"Task '{task.id}' cannot depend on itself")
-
-        # Check for circular dependencies (simple check)
-        # Build dependency graph and check for cycles
-        graph: Dict[str, List[str]] = {task.id: [] for task in tasks}
-        for task in tasks:
-            if task.depends_on:
-                graph[task.id] = task.depends_on
-
-        # DFS to detect cycles
-        visited = set()
-        rec_stack = set()
-
-        def has_cycle(node: str) -> bool:
-            visited.add(node)
-            rec_stack.add(node)
-            for neighbor in graph.get(node, []):
-                if neighbor not in visited:
-                    if has_cycle(neighbor):
-                        return True
-                elif neighbor in rec_stack:
-                    return True
-            rec_stack.remove(node)
-            return False
-
-        for task_id in task_ids:
-            if task_id not in visited:
-                if has_cycle(task_id):
-                    raise ValueError(f"Circular dependency detected in task '{task_id}'")
-
-        return tasks
-
+        if graph.has_dependency_errors:
+            for task in self.tasks:
+                unknown = graph.unknown_dependencies.get(task.id)
+                if unknown:
+                    raise ValueError(f"Task '{task.id}' depends on unknown task '{unknown[0]}'")
+                if task.id in graph.self_dependent_ids:
+                    raise ValueError(f"Task '{task.id}' cannot depend on itself")
+
+        # Check for circular dependencies
+        if graph.cycle_task_id is not None:
+            raise ValueError(f"Circular dependency detected in task '{graph.cycle_task_id}'")
+
+        return self
@@ -1,6 +1,7 @@
 """Workflow definition validator."""
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from workflow_engine.dsl.graph import WorkflowGraph, analyze_workflow
 from workflow_engine.dsl.schema import WorkflowDefinition, Task
 
 
@@ -32,14 +33,17 @@ class WorkflowValidator:
             errors.append("Workflow must have at least one task")
             return errors
 
+        # Analyze the current tasks rather than trusting state derived when
+        # the model was built; the task list may have changed since
+        graph = analyze_workflow(workflow.tasks)
+
         # Validate task IDs are unique
-        task_ids = [task.id for task in workflow.tasks]
-        if len(task_ids) != len(set(task_ids)):
+        if graph.has_duplicate_ids:
             errors.append("Task IDs must be unique")
 
         # Validate each task
         for task in workflow.tasks:
-            task_errors = WorkflowValidator._validate_task(task, workflow.tasks)
+            task_errors = WorkflowValidator._validate_task(task, workflow.tasks, graph)
             errors.extend([f"Task '{task.id}': {e}" for e in task_errors])
 
         # Validate parameters
@@ -50,12 +54,13 @@ class WorkflowValidator:
         return errors
 
     @staticmethod
-    def _validate_task(task: Task, all_tasks: List[Task]) -> List[str]:
+    def _validate_task(task: Task, all_tasks: List[Task], graph: Optional[WorkflowGraph] = None) -> List[str]:
         """Validate a single task.
 
         Args:
             task: Task to validate
             all_tasks: All tasks in the workflow
+            graph: Dependency graph of ``all_tasks``, analyzed here if not given
 
         Returns:
             List of validation errors for this task
@@ -76,12 +81,12 @@ class WorkflowValidator:
 
         # Validate dependencies
         if task.depends_on:
-            task_ids = {t.id for t in all_tasks}
-            for dep_id in task.depends_on:
-                if dep_id not in task_ids:
-                    errors.append(f"Dependency '{dep_id}' does not exist")
-                if dep_id == task.id:
-                    errors.append("Task cannot depend on itself")
+            if graph is None:
+                graph = analyze_workflow(all_tasks)
+            for dep_id in graph.unknown_dependencies.get(task.id, ()):
+                errors.append(f"Dependency '{dep_id}' does not exist")
+            if task.id in graph.self_dependent_ids:
+                errors.append("Task cannot depend on itself")
 
         return errors
 
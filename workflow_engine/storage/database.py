@@ -1,9 +1,12 @@
 """Database connection and session management."""
 
-from sqlalchemy import create_engine
+import asyncio
+from sqlalchemy import create_engine, make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base, sessionmaker
-from typing import AsyncGenerator
+from sqlalchemy.pool import NullPool
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import AsyncIterator, Optional
 
 # Base class for all models
 Base = declarative_base()
@@ -17,16 +20,75 @@ sync_engine = None
 SessionLocal = None
 
 
-def init_db(database_url: str, async_database_url: str = None) -> None:
-    """Initialize database connections."""
+def to_asyncpg_url(database_url: str) -> str:
+    """Rewrite a PostgreSQL URL to use the asyncpg driver.
+
+    Handles any driver suffix (``postgresql+psycopg2://``) and the ``postgres://``
+    alias, which a plain string replace of ``postgresql://`` would leave on a
+    sync driver.
+
+    Args:
+        database_url: PostgreSQL database URL
+
+    Returns:
+        Equivalent ``postgresql+asyncpg://`` URL
+    """
+    return make_url(database_url).set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+
+
+def init_db(
+    database_url: str,
+    async_database_url: str = None,
+    pool_size: int = 20,
+    max_overflow: int = 10,
+    pool_timeout: float = 30,
+    pool_recycle: int = 1800,
+    pool_pre_ping: bool = True,
+    use_null_pool: bool = False,
+    prepared_statement_cache_size: int = 500,
+) -> None:
+    """Initialize database connections.
+
+    Args:
+        database_url: Sync database URL (migrations, schema setup)
+        async_database_url: Async database URL for application use
+        pool_size: Connections kept open in the async pool
+        max_overflow: Extra connections allowed beyond ``pool_size`` under load
+        pool_timeout: Seconds to wait for a free connection before failing
+        pool_recycle: Seconds after which a pooled connection is replaced
+        pool_pre_ping: Check connections on checkout so a database restart
+            does not surface as errors on stale connections
+        use_null_pool: Open a fresh connection per session instead of pooling,
+            for short-lived processes or when an external pooler (e.g.
+            PgBouncer) already pools connections; the pool options are ignored
+        prepared_statement_cache_size: Prepared statements kept per asyncpg
+            connection, so repeated queries skip re-preparing; 0 disables
+            them (required behind PgBouncer in transaction pooling mode)
+    """
     global async_engine, AsyncSessionLocal, sync_engine, SessionLocal
 
     # Async engine for application use
     if async_database_url:
+        if use_null_pool:
+            pool_options = {"poolclass": NullPool}
+        else:
+            pool_options = {
+                "pool_size": pool_size,
+                "max_overflow": max_overflow,
+                "pool_timeout": pool_timeout,
+                "pool_recycle": pool_recycle,
+                "pool_pre_ping": pool_pre_ping,
+            }
+        connect_args = {"prepared_statement_cache_size": prepared_statement_cache_size}
+        if prepared_statement_cache_size == 0:
+            # Also stop asyncpg from preparing statements on its own
+            connect_args["statement_cache_size"] = 0
         async_engine = create_async_engine(
             async_database_url,
             echo=False,
             future=True,
+            connect_args=connect_args,
+            **pool_options,
         )
         AsyncSessionLocal = async_sessionmaker(
             async_engine,
@@ -50,8 +112,36 @@ def init_db(database_url: str, async_database_url: str = None) -> None:
     )
 
 
-async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
-    """Get async database session."""
+async def warm_pool(connections: Optional[int] = None) -> int:
+    """Open pooled async connections ahead of the first requests.
+
+    Connections are checked out concurrently and held until all are open,
+    then returned to the pool, so a startup burst does not pay connection
+    setup (TCP, TLS, authentication) on every session. Does nothing without
+    a pooled async engine.
+
+    Args:
+        connections: Number of connections to open; defaults to the pool size
+
+    Returns:
+        Number of connections opened
+    """
+    if async_engine is None or isinstance(async_engine.pool, NullPool):
+        return 0
+    if connections is None:
+        connections = async_engine.pool.size()
+    async with AsyncExitStack() as stack:
+        await asyncio.gather(*(stack.enter_async_context(async_engine.connect()) for _ in range(connections)))
+    return connections
+
+
+@asynccontextmanager
+async def get_async_session() -> AsyncIterator[AsyncSession]:
+    """Get async database session.
+
+    Use as ``async with get_async_session() as session:``. The session is
+    committed when the block exits normally and rolled back on error.
+    """
     if AsyncSessionLocal is None:
         raise RuntimeError("Database not initialized. Call init_db() first.")
     async with AsyncSessionLocal() as session:
@@ -65,6 +155,19 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+@asynccontextmanager
+async def get_read_session() -> AsyncIterator[AsyncSession]:
+    """Get async database session for read-only work.
+
+    Unlike ``get_async_session`` it never commits; the implicit transaction
+    is simply released when the block exits.
+    """
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Database not initialized. Call init_db() first.")
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
 def get_sync_session():
     """Get sync database session (for migrations)."""
     if SessionLocal is None:
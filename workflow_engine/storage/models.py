@@ -1,18 +1,29 @@
 """Database models for workflow definitions and executions."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 from uuid import uuid4, UUID
 
-from sqlalchemy import Column, String, DateTime, ForeignKey, JSON, Text, Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index, Text, Enum as SQLEnum, func, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PostgresUUID
 from sqlalchemy.orm import relationship
 import enum
 
 from workflow_engine.storage.database import Base
 
 # Export Base for use in other modules
-__all__ = ["Base", "WorkflowDefinition", "WorkflowExecution", "WorkflowExecutionStatus", "ApprovalRequest", "ApprovalStatus"]
+__all__ = ["Base", "utcnow", "WorkflowDefinition", "WorkflowExecution", "WorkflowExecutionStatus", "ApprovalRequest", "ApprovalStatus"]
+
+
+def utcnow() -> datetime:
+    """Current UTC time as a naive datetime, matching the timezone-naive columns."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+# Database-side equivalent of utcnow() for column defaults, so row timestamps
+# come from one clock instead of each writer's host. clock_timestamp() rather
+# than now() keeps rows inserted in one transaction in insertion order.
+SERVER_UTCNOW = func.timezone("UTC", func.clock_timestamp())
 
 
 class WorkflowExecutionStatus(str, enum.Enum):
@@ -38,15 +49,17 @@ class WorkflowDefinition(Base):
     """Workflow definition model."""
 
     __tablename__ = "workflow_definitions"
+    # Read server-generated timestamps back with INSERT/UPDATE ... RETURNING
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(PostgresUUID(as_uuid=True), primary_key=True, default=uuid4)
     name = Column(String(255), unique=True, nullable=False, index=True)
     version = Column(String(50), nullable=False, default="1.0")
     description = Column(Text, nullable=True)
     definition_yaml = Column(Text, nullable=False)  # Raw YAML
-    definition_json = Column(JSON, nullable=False)  # Parsed structure
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    definition_json = Column(JSONB, nullable=False)  # Parsed structure
+    created_at = Column(DateTime, nullable=False, server_default=SERVER_UTCNOW)
+    updated_at = Column(DateTime, nullable=False, server_default=SERVER_UTCNOW, onupdate=SERVER_UTCNOW)
 
     # Relationship
     executions = relationship("WorkflowExecution", back_populates="workflow_definition", cascade="all, delete-orphan")
@@ -59,31 +72,58 @@ class WorkflowExecution(Base):
     """Workflow execution model."""
 
     __tablename__ = "workflow_executions"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(PostgresUUID(as_uuid=True), primary_key=True, default=uuid4)
     workflow_definition_id = Column(
         PostgresUUID(as_uuid=True),
         ForeignKey("workflow_definitions.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
-    )
+    )  # Indexed by ix_workflow_executions_workflow_definition_id_created_at
     workflow_definition_name = Column(String(255), nullable=False, index=True)  # Denormalized for queries
     status = Column(
         SQLEnum(WorkflowExecutionStatus),
         nullable=False,
         default=WorkflowExecutionStatus.PENDING,
-        index=True,
-    )
+    )  # Indexed by ix_workflow_executions_status_created_at
     temporal_workflow_id = Column(String(255), nullable=True, unique=True, index=True)
-    parameters = Column(JSON, nullable=False, default=dict)
-    result = Column(JSON, nullable=True)
+    parameters = Column(JSONB, nullable=False, default=dict)
+    result = Column(JSONB, nullable=True)
     error = Column(Text, nullable=True)
+    # started_at/completed_at come from the application's clock at the start and
+    # end of the run; created_at is when the row was persisted, on the database's
+    # clock. Rows are inserted after Temporal accepts the run, so created_at is
+    # normally a little later than started_at and the two are not comparable.
     started_at = Column(DateTime, nullable=True)
     completed_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
-
-    # Relationship
-    workflow_definition = relationship("WorkflowDefinition", back_populates="executions")
+    created_at = Column(DateTime, nullable=False, server_default=SERVER_UTCNOW, index=True)
+
+    # Relationship; list queries never need it (the name is denormalized), so an
+    # accidental per-row lazy load raises instead of issuing N extra queries
+    workflow_definition = relationship("WorkflowDefinition", back_populates="executions", lazy="raise_on_sql")
+
+    __table_args__ = (
+        # Serves status-filtered listings newest first (and plain status lookups)
+        # with one index range scan instead of a scan plus sort
+        Index("ix_workflow_executions_status_created_at", "status", created_at.desc()),
+        # Same for a workflow's executions; also serves the foreign key lookups
+        Index(
+            "ix_workflow_executions_workflow_definition_id_created_at",
+            "workflow_definition_id",
+            created_at.desc(),
+        ),
+        # Block-range indexes for time-window queries; rows are written roughly in
+        # time order, so these stay tiny compared to B-trees
+        Index("ix_workflow_executions_started_at_brin", "started_at", postgresql_using="brin"),
+        Index("ix_workflow_executions_completed_at_brin", "completed_at", postgresql_using="brin"),
+        # Containment lookups on parameters (parameters @> '{"customer_id": "..."}')
+        Index(
+            "ix_workflow_executions_parameters_gin",
+            "parameters",
+            postgresql_using="gin",
+            postgresql_ops={"parameters": "jsonb_path_ops"},
+        ),
+    )
 
     def __repr__(self) -> str:
         return f"<WorkflowExecution(id={self.id}, workflow={self.workflow_definition_name}, status={self.status})>"
@@ -93,6 +133,7 @@ class ApprovalRequest(Base):
     """Human approval request model."""
 
     __tablename__ = "approval_requests"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(PostgresUUID(as_uuid=True), primary_key=True, default=uuid4)
     approval_id = Column(String(255), unique=True, nullable=False, index=True)  # User-provided approval ID
@@ -100,26 +141,52 @@ class ApprovalRequest(Base):
         PostgresUUID(as_uuid=True),
         ForeignKey("workflow_executions.id", ondelete="CASCADE"),
         nullable=True,
-        index=True,
-    )
+    )  # Indexed by ix_approval_requests_workflow_execution_id_created_at
     task_id = Column(String(255), nullable=True)  # Task ID that requested approval
     status = Column(
         SQLEnum(ApprovalStatus),
         nullable=False,
         default=ApprovalStatus.PENDING,
-        index=True,
-    )
+    )  # Pending lookups use ix_approval_requests_pending_created_at
     title = Column(String(255), nullable=True)  # Human-readable title
     description = Column(Text, nullable=True)  # Approval request description
-    context = Column(JSON, nullable=True)  # Additional context data
+    context = Column(JSONB, nullable=True)  # Additional context data
     approved_by = Column(String(255), nullable=True)  # Who approved/rejected
     comment = Column(Text, nullable=True)  # Approval/rejection comment
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+    created_at = Column(DateTime, nullable=False, server_default=SERVER_UTCNOW, index=True)
     responded_at = Column(DateTime, nullable=True)
     expires_at = Column(DateTime, nullable=True)  # Optional expiration time
 
-    # Relationship
-    workflow_execution = relationship("WorkflowExecution", foreign_keys=[workflow_execution_id])
+    # Relationship; not loaded by list queries, load explicitly with selectinload if needed
+    workflow_execution = relationship("WorkflowExecution", foreign_keys=[workflow_execution_id], lazy="raise_on_sql")
+
+    __table_args__ = (
+        # Pattern-ops index so prefix (LIKE 'abc%') lookups can use an index scan
+        # regardless of the database collation
+        Index(
+            "ix_approval_requests_approval_id_pattern",
+            "approval_id",
+            postgresql_ops={"approval_id": "varchar_pattern_ops"},
+        ),
+        # Serves an execution's approvals newest first without a sort
+        Index(
+            "ix_approval_requests_workflow_execution_id_created_at",
+            "workflow_execution_id",
+            created_at.desc(),
+        ),
+        # Partial index over the (few) pending requests for list_pending/count_pending
+        Index(
+            "ix_approval_requests_pending_created_at",
+            created_at.desc(),
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+        # Finds expired pending requests for timeout sweeps (list_expired)
+        Index(
+            "ix_approval_requests_pending_expires_at",
+            "expires_at",
+            postgresql_where=text("status = 'PENDING' AND expires_at IS NOT NULL"),
+        ),
+    )
 
     def __repr__(self) -> str:
         return f"<ApprovalRequest(id={self.id}, approval_id={self.approval_id}, status={self.status})>"
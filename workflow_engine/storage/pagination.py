@@ -0,0 +1,58 @@
+"""Keyset pagination over (created_at, id), newest first.
+
+OFFSET pagination makes the database read and discard every skipped row, so
+deep pages get slower the further in they are. A keyset cursor holds the
+sort key of the last row returned; the next page starts right after it, which
+costs the same at any depth and stays stable while new rows are inserted.
+"""
+
+from datetime import datetime
+from typing import Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+# (created_at, id) of the last row on the previous page
+PageCursor = Tuple[datetime, UUID]
+
+
+def before_cursor(created_at: ColumnElement, id_: ColumnElement, cursor: PageCursor) -> ColumnElement:
+    """Filter for rows after ``cursor`` in (created_at DESC, id DESC) order.
+
+    Written as a range on created_at plus a tie-break, rather than a row value
+    comparison, so (…, created_at DESC) indexes can bound the scan.
+    """
+    cursor_created_at, cursor_id = cursor
+    return and_(
+        created_at <= cursor_created_at,
+        or_(created_at < cursor_created_at, id_ < cursor_id),
+    )
+
+
+def encode_cursor(rows: Sequence, limit: int) -> Optional[str]:
+    """Build the cursor for the page after ``rows``.
+
+    Args:
+        rows: Rows of the current page (with ``created_at`` and ``id``)
+        limit: Page size that was requested
+
+    Returns:
+        Opaque cursor string, or None if this was the last page
+    """
+    if len(rows) < limit or not rows:
+        return None
+    last = rows[-1]
+    return f"{last.created_at.isoformat()},{last.id}"
+
+
+def decode_cursor(cursor: str) -> PageCursor:
+    """Parse a cursor produced by ``encode_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    created_at, sep, row_id = cursor.partition(",")
+    if not sep:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return datetime.fromisoformat(created_at), UUID(row_id)
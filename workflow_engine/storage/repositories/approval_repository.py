@@ -1,10 +1,17 @@
 """Approval repository interface."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Sequence
+from datetime import datetime
 from uuid import UUID
 
+from sqlalchemy import Row
+
 from workflow_engine.storage.models import ApprovalRequest, ApprovalStatus
+from workflow_engine.storage.pagination import PageCursor
+
+# PostgreSQL NOTIFY channel carrying the approval_id of updated approval requests
+APPROVAL_CHANNEL = "approval_updates"
 
 
 class ApprovalRepository(ABC):
@@ -20,6 +27,11 @@ class ApprovalRepository(ABC):
         """Get approval request by approval_id."""
         pass
 
+    @abstractmethod
+    async def get_status_for_poll(self, approval_id: str) -> Optional[Row]:
+        """Get (status, approved_by, responded_at, comment) for an approval_id."""
+        pass
+
     @abstractmethod
     async def get_by_id(self, approval_request_id: UUID) -> Optional[ApprovalRequest]:
         """Get approval request by ID."""
@@ -31,14 +43,70 @@ class ApprovalRepository(ABC):
         pass
 
     @abstractmethod
-    async def list_pending(self, skip: int = 0, limit: int = 100) -> List[ApprovalRequest]:
-        """List pending approval requests."""
+    async def mark_timeout(self, approval_id: str, responded_at: datetime) -> bool:
+        """Mark a still-pending approval request as timed out."""
+        pass
+
+    @abstractmethod
+    async def list_expired(self, now: datetime, limit: int = 1000) -> List[UUID]:
+        """Get IDs of pending approval requests whose expires_at has passed, oldest first."""
+        pass
+
+    @abstractmethod
+    async def mark_timeout_many(self, approval_request_ids: Sequence[UUID], responded_at: datetime) -> List[str]:
+        """Mark the still-pending requests among the given IDs as timed out.
+
+        Returns:
+            approval_id of each request that was updated
+        """
+        pass
+
+    @abstractmethod
+    async def notify_updated(self, approval_id: str) -> None:
+        """Signal waiting workers that an approval request changed (sent on commit)."""
+        pass
+
+    @abstractmethod
+    async def list_pending(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        before: Optional[PageCursor] = None,
+    ) -> List[ApprovalRequest]:
+        """List pending approval requests, newest first.
+
+        ``before`` continues from a keyset cursor (see ``storage.pagination``)
+        and is preferred over ``skip`` for deep pages.
+        """
+        pass
+
+    @abstractmethod
+    async def count_pending(self) -> int:
+        """Count pending approval requests."""
+        pass
+
+    @abstractmethod
+    async def get_pending_by_prefix(self, prefix: str) -> Optional[ApprovalRequest]:
+        """Get the most recent pending approval request whose approval_id starts with prefix."""
         pass
 
     @abstractmethod
     async def list_by_execution_id(
-        self, execution_id: UUID, skip: int = 0, limit: int = 100
+        self,
+        execution_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[ApprovalStatus] = None,
+        before: Optional[PageCursor] = None,
     ) -> List[ApprovalRequest]:
-        """List approval requests for a workflow execution."""
+        """List approval requests for a workflow execution with optional status filter, newest first."""
         pass
 
+    @abstractmethod
+    async def count_by_execution_id(
+        self,
+        execution_id: UUID,
+        status: Optional[ApprovalStatus] = None,
+    ) -> int:
+        """Count approval requests for a workflow execution with optional status filter."""
+        pass
@@ -1,10 +1,11 @@
 """Repository for workflow executions."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Sequence, Set, Tuple
 from uuid import UUID
 
 from workflow_engine.storage.models import WorkflowExecution, WorkflowExecutionStatus
+from workflow_engine.storage.pagination import PageCursor
 
 
 class ExecutionRepository(ABC):
@@ -25,14 +26,24 @@ class ExecutionRepository(ABC):
         """Get execution by Temporal workflow ID."""
         pass
 
+    @abstractmethod
+    async def get_id_by_any(self, execution_id: str) -> Optional[UUID]:
+        """Get the ID of the execution matching an ID string or its derived Temporal workflow ID."""
+        pass
+
     @abstractmethod
     async def list_by_workflow(
         self,
         workflow_id: UUID,
         skip: int = 0,
         limit: int = 100,
+        before: Optional[PageCursor] = None,
     ) -> List[WorkflowExecution]:
-        """List executions for a workflow."""
+        """List executions for a workflow, newest first.
+
+        ``before`` continues from a keyset cursor (see ``storage.pagination``)
+        and is preferred over ``skip`` for deep pages.
+        """
         pass
 
     @abstractmethod
@@ -41,8 +52,18 @@ class ExecutionRepository(ABC):
         skip: int = 0,
         limit: int = 100,
         status: Optional[WorkflowExecutionStatus] = None,
+        before: Optional[PageCursor] = None,
     ) -> List[WorkflowExecution]:
-        """List all executions with optional status filter."""
+        """List all executions with optional status filter, newest first."""
+        pass
+
+    @abstractmethod
+    async def count(
+        self,
+        workflow_id: Optional[UUID] = None,
+        status: Optional[WorkflowExecutionStatus] = None,
+    ) -> int:
+        """Count executions with optional workflow and status filters."""
         pass
 
     @abstractmethod
@@ -61,3 +82,10 @@ class ExecutionRepository(ABC):
         """Update execution status."""
         pass
 
+    @abstractmethod
+    async def finalize_many(
+        self,
+        updates: Sequence[Tuple[UUID, WorkflowExecutionStatus, Optional[dict], Optional[str]]],
+    ) -> Set[UUID]:
+        """Set status/result/error for several executions at once; returns the IDs that exist."""
+        pass
@@ -1,13 +1,15 @@
 """SQLAlchemy implementation of approval repository."""
 
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Sequence
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import Row, lambda_stmt, select, update, and_, func
 
 from workflow_engine.storage.models import ApprovalRequest, ApprovalStatus
-from workflow_engine.storage.repositories.approval_repository import ApprovalRepository
+from workflow_engine.storage.pagination import PageCursor, before_cursor
+from workflow_engine.storage.repositories.approval_repository import ApprovalRepository, APPROVAL_CHANNEL
 
 
 class SQLAlchemyApprovalRepository(ApprovalRepository):
@@ -21,52 +23,189 @@ class SQLAlchemyApprovalRepository(ApprovalRepository):
         """Create a new approval request."""
         self.session.add(approval)
         await self.session.flush()
-        await self.session.refresh(approval)
         return approval
 
     async def get_by_approval_id(self, approval_id: str) -> Optional[ApprovalRequest]:
         """Get approval request by approval_id."""
         result = await self.session.execute(
-            select(ApprovalRequest).where(ApprovalRequest.approval_id == approval_id)
+            lambda_stmt(lambda: select(ApprovalRequest).where(ApprovalRequest.approval_id == approval_id).limit(1))
         )
-        return result.scalar_one_or_none()
+        return result.scalars().first()
 
-    async def get_by_id(self, approval_request_id: UUID) -> Optional[ApprovalRequest]:
-        """Get approval request by ID."""
+    async def get_status_for_poll(self, approval_id: str) -> Optional[Row]:
+        """Get (status, approved_by, responded_at, comment) for an approval_id.
+
+        Selects only the columns a waiting activity needs, without loading
+        the full ORM object. Built as a lambda statement, since waiting
+        activities poll it repeatedly, so the statement is not rebuilt and
+        re-keyed for the compiled cache on every call.
+        """
         result = await self.session.execute(
-            select(ApprovalRequest).where(ApprovalRequest.id == approval_request_id)
+            lambda_stmt(
+                lambda: select(
+                    ApprovalRequest.status,
+                    ApprovalRequest.approved_by,
+                    ApprovalRequest.responded_at,
+                    ApprovalRequest.comment,
+                ).where(ApprovalRequest.approval_id == approval_id)
+            )
         )
-        return result.scalar_one_or_none()
+        return result.one_or_none()
+
+    async def get_by_id(self, approval_request_id: UUID) -> Optional[ApprovalRequest]:
+        """Get approval request by ID (no query if already loaded in this session)."""
+        return await self.session.get(ApprovalRequest, approval_request_id)
 
     async def update(self, approval: ApprovalRequest) -> ApprovalRequest:
         """Update approval request."""
         # Add the approval to the session if it's not already tracked
         self.session.add(approval)
         await self.session.flush()
-        await self.session.refresh(approval)
         return approval
 
-    async def list_pending(self, skip: int = 0, limit: int = 100) -> List[ApprovalRequest]:
-        """List pending approval requests."""
+    async def mark_timeout(self, approval_id: str, responded_at: datetime) -> bool:
+        """Mark a still-pending approval request as timed out.
+
+        Single conditional UPDATE; returns False if the request was already
+        resolved (or does not exist).
+        """
         result = await self.session.execute(
-            select(ApprovalRequest)
-            .where(ApprovalRequest.status == ApprovalStatus.PENDING)
-            .offset(skip)
+            update(ApprovalRequest)
+            .where(
+                ApprovalRequest.approval_id == approval_id,
+                ApprovalRequest.status == ApprovalStatus.PENDING,
+            )
+            .values(status=ApprovalStatus.TIMEOUT, responded_at=responded_at)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount > 0
+
+    async def list_expired(self, now: datetime, limit: int = 1000) -> List[UUID]:
+        """Get IDs of pending approval requests whose expires_at has passed, oldest first.
+
+        Served by the partial index ix_approval_requests_pending_expires_at, so a
+        periodic sweep only reads the pending requests that have an expiry.
+        """
+        result = await self.session.execute(
+            select(ApprovalRequest.id)
+            .where(
+                ApprovalRequest.status == ApprovalStatus.PENDING,
+                ApprovalRequest.expires_at.is_not(None),
+                ApprovalRequest.expires_at < now,
+            )
+            .order_by(ApprovalRequest.expires_at)
             .limit(limit)
-            .order_by(ApprovalRequest.created_at.desc())
         )
         return list(result.scalars().all())
 
-    async def list_by_execution_id(
-        self, execution_id: UUID, skip: int = 0, limit: int = 100
+    async def mark_timeout_many(self, approval_request_ids: Sequence[UUID], responded_at: datetime) -> List[str]:
+        """Mark the still-pending requests among the given IDs as timed out in one UPDATE.
+
+        Requests resolved since they were listed are left alone.
+
+        Returns:
+            approval_id of each request that was updated
+        """
+        if not approval_request_ids:
+            return []
+        result = await self.session.execute(
+            update(ApprovalRequest)
+            .where(
+                ApprovalRequest.id.in_(approval_request_ids),
+                ApprovalRequest.status == ApprovalStatus.PENDING,
+            )
+            .values(status=ApprovalStatus.TIMEOUT, responded_at=responded_at)
+            .returning(ApprovalRequest.approval_id)
+            .execution_options(synchronize_session=False)
+        )
+        return list(result.scalars().all())
+
+    async def notify_updated(self, approval_id: str) -> None:
+        """Signal waiting workers that an approval request changed.
+
+        PostgreSQL delivers the notification when the transaction commits.
+        """
+        await self.session.execute(
+            select(func.pg_notify(APPROVAL_CHANNEL, approval_id))
+        )
+
+    async def list_pending(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        before: Optional[PageCursor] = None,
     ) -> List[ApprovalRequest]:
-        """List approval requests for a workflow execution."""
+        """List pending approval requests."""
+        query = select(ApprovalRequest).where(ApprovalRequest.status == ApprovalStatus.PENDING)
+        return await self._list_page(query, skip, limit, before)
+
+    async def count_pending(self) -> int:
+        """Count pending approval requests."""
+        result = await self.session.execute(
+            select(func.count())
+            .select_from(ApprovalRequest)
+            .where(ApprovalRequest.status == ApprovalStatus.PENDING)
+        )
+        return result.scalar_one()
+
+    async def get_pending_by_prefix(self, prefix: str) -> Optional[ApprovalRequest]:
+        """Get the most recent pending approval request whose approval_id starts with prefix."""
+        # Bind the complete LIKE pattern so the planner sees a literal prefix
+        pattern = prefix.replace("/", "//").replace("%", "/%").replace("_", "/_") + "%"
         result = await self.session.execute(
             select(ApprovalRequest)
-            .where(ApprovalRequest.workflow_execution_id == execution_id)
-            .offset(skip)
-            .limit(limit)
+            .where(
+                ApprovalRequest.approval_id.like(pattern, escape="/"),
+                ApprovalRequest.status == ApprovalStatus.PENDING,
+            )
             .order_by(ApprovalRequest.created_at.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    async def list_by_execution_id(
+        self,
+        execution_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[ApprovalStatus] = None,
+        before: Optional[PageCursor] = None,
+    ) -> List[ApprovalRequest]:
+        """List approval requests for a workflow execution with optional status filter."""
+        query = select(ApprovalRequest).where(ApprovalRequest.workflow_execution_id == execution_id)
+        if status:
+            query = query.where(ApprovalRequest.status == status)
+        return await self._list_page(query, skip, limit, before)
+
+    async def _list_page(
+        self,
+        query,
+        skip: int,
+        limit: int,
+        before: Optional[PageCursor],
+    ) -> List[ApprovalRequest]:
+        """Run a listing newest first, continuing after ``before`` if given."""
+        if before is not None:
+            query = query.where(before_cursor(ApprovalRequest.created_at, ApprovalRequest.id, before))
+        elif skip:
+            query = query.offset(skip)
+        result = await self.session.execute(
+            query.order_by(ApprovalRequest.created_at.desc(), ApprovalRequest.id.desc()).limit(limit)
         )
         return list(result.scalars().all())
 
+    async def count_by_execution_id(
+        self,
+        execution_id: UUID,
+        status: Optional[ApprovalStatus] = None,
+    ) -> int:
+        """Count approval requests for a workflow execution with optional status filter."""
+        query = (
+            select(func.count())
+            .select_from(ApprovalRequest)
+            .where(ApprovalRequest.workflow_execution_id == execution_id)
+        )
+        if status:
+            query = query.where(ApprovalRequest.status == status)
+        result = await self.session.execute(query)
+        return result.scalar_one()
@@ -1,14 +1,25 @@
 """SQLAlchemy implementation of execution repository."""
 
-from typing import Optional, List
+from typing import Optional, List, Sequence, Set, Tuple
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Boolean, DateTime, Text, bindparam, case, lambda_stmt, select, update, func, or_
+from sqlalchemy.dialects.postgresql import JSONB
 
-from workflow_engine.storage.models import WorkflowExecution, WorkflowExecutionStatus
+from workflow_engine.storage.pagination import PageCursor, before_cursor
+from workflow_engine.storage.models import WorkflowExecution, WorkflowExecutionStatus, utcnow
 from workflow_engine.storage.repositories.execution_repository import ExecutionRepository
 
+# Temporal workflow IDs are "workflow-<execution id>" (see WorkflowService.execute_workflow)
+_TEMPORAL_WF_PREFIX = "workflow-"
+
+_TERMINAL_STATUSES = frozenset({
+    WorkflowExecutionStatus.COMPLETED,
+    WorkflowExecutionStatus.FAILED,
+    WorkflowExecutionStatus.CANCELLED,
+})
+
 
 class SQLAlchemyExecutionRepository(ExecutionRepository):
     """SQLAlchemy implementation of ExecutionRepository."""
@@ -21,20 +32,37 @@ class SQLAlchemyExecutionRepository(ExecutionRepository):
         """Create a new workflow execution."""
         self.session.add(execution)
         await self.session.flush()
-        await self.session.refresh(execution)
         return execution
 
     async def get_by_id(self, execution_id: UUID) -> Optional[WorkflowExecution]:
-        """Get execution by ID."""
-        result = await self.session.execute(
-            select(WorkflowExecution).where(WorkflowExecution.id == execution_id)
-        )
-        return result.scalar_one_or_none()
+        """Get execution by ID (no query if already loaded in this session)."""
+        return await self.session.get(WorkflowExecution, execution_id)
 
     async def get_by_temporal_id(self, temporal_workflow_id: str) -> Optional[WorkflowExecution]:
         """Get execution by Temporal workflow ID."""
         result = await self.session.execute(
-            select(WorkflowExecution).where(WorkflowExecution.temporal_workflow_id == temporal_workflow_id)
+            lambda_stmt(
+                lambda: select(WorkflowExecution)
+                .where(WorkflowExecution.temporal_workflow_id == temporal_workflow_id)
+                .limit(1)
+            )
+        )
+        return result.scalars().first()
+
+    async def get_id_by_any(self, execution_id: str) -> Optional[UUID]:
+        """Get the ID of the execution matching an ID string or its derived Temporal workflow ID.
+
+        Matches ``id`` (when the string is a UUID) or ``temporal_workflow_id ==
+        "workflow-<execution_id>"`` in a single query, loading only the ``id``
+        column.
+        """
+        condition = WorkflowExecution.temporal_workflow_id == _TEMPORAL_WF_PREFIX + execution_id
+        try:
+            condition = or_(WorkflowExecution.id == UUID(execution_id), condition)
+        except (ValueError, TypeError):
+            pass
+        result = await self.session.execute(
+            select(WorkflowExecution.id).where(condition).limit(1)
         )
         return result.scalar_one_or_none()
 
@@ -43,36 +71,59 @@ class SQLAlchemyExecutionRepository(ExecutionRepository):
         workflow_id: UUID,
         skip: int = 0,
         limit: int = 100,
+        before: Optional[PageCursor] = None,
     ) -> List[WorkflowExecution]:
         """List executions for a workflow."""
-        result = await self.session.execute(
-            select(WorkflowExecution)
-            .where(WorkflowExecution.workflow_definition_id == workflow_id)
-            .offset(skip)
-            .limit(limit)
-            .order_by(WorkflowExecution.created_at.desc())
-        )
-        return list(result.scalars().all())
+        query = select(WorkflowExecution).where(WorkflowExecution.workflow_definition_id == workflow_id)
+        return await self._list_page(query, skip, limit, before)
 
     async def list_all(
         self,
         skip: int = 0,
         limit: int = 100,
         status: Optional[WorkflowExecutionStatus] = None,
+        before: Optional[PageCursor] = None,
     ) -> List[WorkflowExecution]:
         """List all executions with optional status filter."""
         query = select(WorkflowExecution)
         if status:
             query = query.where(WorkflowExecution.status == status)
+        return await self._list_page(query, skip, limit, before)
+
+    async def _list_page(
+        self,
+        query,
+        skip: int,
+        limit: int,
+        before: Optional[PageCursor],
+    ) -> List[WorkflowExecution]:
+        """Run a listing newest first, continuing after ``before`` if given."""
+        if before is not None:
+            query = query.where(before_cursor(WorkflowExecution.created_at, WorkflowExecution.id, before))
+        elif skip:
+            query = query.offset(skip)
         result = await self.session.execute(
-            query.offset(skip).limit(limit).order_by(WorkflowExecution.created_at.desc())
+            query.order_by(WorkflowExecution.created_at.desc(), WorkflowExecution.id.desc()).limit(limit)
         )
         return list(result.scalars().all())
 
+    async def count(
+        self,
+        workflow_id: Optional[UUID] = None,
+        status: Optional[WorkflowExecutionStatus] = None,
+    ) -> int:
+        """Count executions with optional workflow and status filters."""
+        query = select(func.count()).select_from(WorkflowExecution)
+        if workflow_id:
+            query = query.where(WorkflowExecution.workflow_definition_id == workflow_id)
+        if status:
+            query = query.where(WorkflowExecution.status == status)
+        result = await self.session.execute(query)
+        return result.scalar_one()
+
     async def update(self, execution: WorkflowExecution) -> WorkflowExecution:
         """Update execution."""
         await self.session.flush()
-        await self.session.refresh(execution)
         return execution
 
     async def update_status(
@@ -82,18 +133,73 @@ class SQLAlchemyExecutionRepository(ExecutionRepository):
         result: Optional[dict] = None,
         error: Optional[str] = None,
     ) -> Optional[WorkflowExecution]:
-        """Update execution status."""
-        execution = await self.get_by_id(execution_id)
-        if not execution:
-            return None
-
-        execution.status = status
+        """Update execution status and return the updated row in one UPDATE ... RETURNING."""
+        values = {"status": status}
         if result is not None:
-            execution.result = result
+            values["result"] = result
         if error is not None:
-            execution.error = error
-
-        await self.session.flush()
-        await self.session.refresh(execution)
-        return execution
+            values["error"] = error
+
+        res = await self.session.execute(
+            update(WorkflowExecution)
+            .where(WorkflowExecution.id == execution_id)
+            .values(**values)
+            .returning(WorkflowExecution)
+            # Overwrite an already-loaded instance with the returned row
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        return res.scalar_one_or_none()
 
+    async def finalize_many(
+        self,
+        updates: Sequence[Tuple[UUID, WorkflowExecutionStatus, Optional[dict], Optional[str]]],
+    ) -> Set[UUID]:
+        """Set status/result/error (and completed_at for terminal states) for several executions.
+
+        Looks up which IDs exist with one SELECT, then sends a single
+        executemany UPDATE for them. A None result or error keeps the stored
+        value, and completed_at is only set once, for terminal states.
+
+        Returns:
+            IDs of the executions that exist (and were updated)
+        """
+        found = set(
+            (await self.session.execute(
+                select(WorkflowExecution.id).where(WorkflowExecution.id.in_({u[0] for u in updates}))
+            )).scalars()
+        )
+        if not found:
+            return found
+
+        now = utcnow()
+        params = [
+            {
+                "b_id": execution_id,
+                "b_status": status,
+                "b_result": result,
+                "b_error": error,
+                "b_terminal": status in _TERMINAL_STATUSES,
+                "b_now": now,
+            }
+            for execution_id, status, result, error in updates
+            if execution_id in found
+        ]
+        stmt = (
+            update(WorkflowExecution.__table__)
+            .where(WorkflowExecution.id == bindparam("b_id"))
+            .values(
+                status=bindparam("b_status", type_=WorkflowExecution.status.type),
+                # none_as_null so a missing result binds SQL NULL (not JSON null) and coalesce keeps the old one
+                result=func.coalesce(bindparam("b_result", type_=JSONB(none_as_null=True)), WorkflowExecution.result),
+                error=func.coalesce(bindparam("b_error", type_=Text), WorkflowExecution.error),
+                completed_at=case(
+                    (
+                        bindparam("b_terminal", type_=Boolean),
+                        func.coalesce(WorkflowExecution.completed_at, bindparam("b_now", type_=DateTime)),
+                    ),
+                    else_=WorkflowExecution.completed_at,
+                ),
+            )
+        )
+        await self.session.execute(stmt, params)
+        return found
@@ -1,10 +1,10 @@
 """SQLAlchemy implementation of workflow repository."""
 
-from typing import Optional, List
+from typing import Iterable, Optional, List
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select, func
 
 from workflow_engine.storage.models import WorkflowDefinition
 from workflow_engine.storage.repositories.workflow_repository import WorkflowRepository
@@ -20,23 +20,27 @@ class SQLAlchemyWorkflowRepository(WorkflowRepository):
     async def create(self, workflow: WorkflowDefinition) -> WorkflowDefinition:
         """Create a new workflow definition."""
         self.session.add(workflow)
+        # Server-generated timestamps come back via RETURNING; no re-SELECT needed
         await self.session.flush()
-        await self.session.refresh(workflow)
         return workflow
 
     async def get_by_id(self, workflow_id: UUID) -> Optional[WorkflowDefinition]:
-        """Get workflow definition by ID."""
-        result = await self.session.execute(
-            select(WorkflowDefinition).where(WorkflowDefinition.id == workflow_id)
-        )
-        return result.scalar_one_or_none()
+        """Get workflow definition by ID (no query if already loaded in this session)."""
+        return await self.session.get(WorkflowDefinition, workflow_id)
 
     async def get_by_name(self, name: str) -> Optional[WorkflowDefinition]:
         """Get workflow definition by name."""
         result = await self.session.execute(
-            select(WorkflowDefinition).where(WorkflowDefinition.name == name)
+            lambda_stmt(lambda: select(WorkflowDefinition).where(WorkflowDefinition.name == name).limit(1))
+        )
+        return result.scalars().first()
+
+    async def get_by_names(self, names: Iterable[str]) -> List[WorkflowDefinition]:
+        """Get the workflow definitions with any of the given names."""
+        result = await self.session.execute(
+            select(WorkflowDefinition).where(WorkflowDefinition.name.in_(list(names)))
         )
-        return result.scalar_one_or_none()
+        return list(result.scalars().all())
 
     async def list_all(self, skip: int = 0, limit: int = 100) -> List[WorkflowDefinition]:
         """List all workflow definitions."""
@@ -45,12 +49,27 @@ class SQLAlchemyWorkflowRepository(WorkflowRepository):
         )
         return list(result.scalars().all())
 
+    async def count(self) -> int:
+        """Count all workflow definitions."""
+        result = await self.session.execute(select(func.count()).select_from(WorkflowDefinition))
+        return result.scalar_one()
+
     async def update(self, workflow: WorkflowDefinition) -> WorkflowDefinition:
         """Update workflow definition."""
         await self.session.flush()
-        await self.session.refresh(workflow)
         return workflow
 
+    async def save_all(self, workflows: List[WorkflowDefinition]) -> List[WorkflowDefinition]:
+        """Insert new and write back modified workflow definitions in one batch.
+
+        All pending INSERTs and UPDATEs go out in a single flush, which
+        SQLAlchemy batches per statement shape. Server-generated timestamps
+        are returned by the statements themselves, so nothing is re-read.
+        """
+        self.session.add_all(workflows)
+        await self.session.flush()
+        return workflows
+
     async def delete(self, workflow_id: UUID) -> bool:
         """Delete workflow definition."""
         workflow = await self.get_by_id(workflow_id)
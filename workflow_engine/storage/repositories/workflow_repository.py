@@ -1,7 +1,7 @@
 """Repository for workflow definitions."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Iterable, Optional, List
 from uuid import UUID
 
 from workflow_engine.storage.models import WorkflowDefinition
@@ -25,16 +25,31 @@ class WorkflowRepository(ABC):
         """Get workflow definition by name."""
         pass
 
+    @abstractmethod
+    async def get_by_names(self, names: Iterable[str]) -> List[WorkflowDefinition]:
+        """Get the workflow definitions with any of the given names."""
+        pass
+
     @abstractmethod
     async def list_all(self, skip: int = 0, limit: int = 100) -> List[WorkflowDefinition]:
         """List all workflow definitions."""
         pass
 
+    @abstractmethod
+    async def count(self) -> int:
+        """Count all workflow definitions."""
+        pass
+
     @abstractmethod
     async def update(self, workflow: WorkflowDefinition) -> WorkflowDefinition:
         """Update workflow definition."""
         pass
 
+    @abstractmethod
+    async def save_all(self, workflows: List[WorkflowDefinition]) -> List[WorkflowDefinition]:
+        """Insert new and write back modified workflow definitions in one batch."""
+        pass
+
     @abstractmethod
     async def delete(self, workflow_id: UUID) -> bool:
         """Delete workflow definition."""
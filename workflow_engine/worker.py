@@ -1,16 +1,22 @@
 """Temporal worker for executing workflows."""
 
 import asyncio
+import contextlib
 import os
 from temporalio.client import Client
 from temporalio.worker import Worker
+from temporalio.worker.workflow_sandbox import SandboxedWorkflowRunner, SandboxRestrictions
 
 from workflow_engine.core.workflows import WorkflowEngineWorkflow
 from workflow_engine.core.task_executor import activity_registry
-# Import activities package to trigger automatic registration of all activities
-# All Python files in workflow_engine/core/activities/ will be automatically discovered and registered
+# Import activities package to register the activities of every module listed in
+# _ACTIVITY_MODULES (workflow_engine/core/activities/__init__.py); add new modules there
 from workflow_engine.core import activities as _activities  # noqa: F401
-from workflow_engine.storage.database import init_db
+from workflow_engine.core.activities.base import close_http_client
+from workflow_engine.core.approval_events import listen_for_approval_updates
+from workflow_engine.core.payload_converter import ORJSON_DATA_CONVERTER
+from workflow_engine.core.status_flusher import status_flusher
+from workflow_engine.storage.database import init_db, to_asyncpg_url, warm_pool
 from workflow_engine.core.workflow_registry import register_all_workflows
 
 
@@ -23,17 +29,19 @@ async def main():
     )
     async_database_url = os.getenv(
         "ASYNC_DATABASE_URL",
-        database_url.replace("postgresql://", "postgresql+asyncpg://"),
+        to_asyncpg_url(database_url),
     )
     init_db(database_url, async_database_url)
-    print("Database initialized for worker")
+    warmed = await warm_pool()
+    print(f"Database initialized for worker ({warmed} pooled connections opened)")
     
     # Auto-register workflows from workflows directory
     print("Registering workflows from workflows directory...")
     registration_results = await register_all_workflows()
     print(
         f"Workflow registration: {registration_results['registered']} registered, "
-        f"{registration_results['updated']} updated, {registration_results['failed']} failed"
+        f"{registration_results['updated']} updated, {registration_results['unchanged']} unchanged, "
+        f"{registration_results['failed']} failed"
     )
     
     # Connect to Temporal
@@ -45,6 +53,7 @@ async def main():
     client = await Client.connect(
         f"{temporal_host}:{temporal_port}",
         namespace=namespace,
+        data_converter=ORJSON_DATA_CONVERTER,
     )
 
     # Auto-discover activities from registry
@@ -71,11 +80,28 @@ async def main():
         task_queue=task_queue,
         workflows=[WorkflowEngineWorkflow],
         activities=registered_activities,
+        # The orjson payload converter also runs inside the workflow sandbox;
+        # pass its native extension through instead of re-importing it there
+        workflow_runner=SandboxedWorkflowRunner(
+            restrictions=SandboxRestrictions.default.with_passthrough_modules("orjson"),
+        ),
     )
 
     print(f"Worker started on task queue: {task_queue}")
     print(f"Registered {len(registered_activities)} activity type(s)")
-    await worker.run()
+    # Relay approval NOTIFYs so waiting human_approval activities wake immediately
+    approval_listener = asyncio.create_task(listen_for_approval_updates())
+    try:
+        await worker.run()
+    finally:
+        # Wait for the listener to unregister before its connection goes back to the pool
+        approval_listener.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await approval_listener
+        # Write execution statuses still waiting for the next batch
+        await status_flusher.close()
+        # Release pooled connections held by the shared HTTP client
+        await close_http_client()
 
 
 if __name__ == "__main__":